@@ -23,10 +23,7 @@ from nomadcastd.server import NomadCastHTTPServer, NomadCastRequestHandler
 
 
 def _local_feed_base_url(config) -> str:
-    host = config.public_host
-    if not host:
-        host = config.listen_host if config.listen_host != "0.0.0.0" else "127.0.0.1"
-    return f"http://{host}:{config.listen_port}"
+    return f"http://{config.resolved_public_host}:{config.listen_port}"
 
 
 def _list_feeds(config_path: Path | None) -> int:
@@ -4,6 +4,7 @@ import configparser
 import logging
 import os
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
 
 DEFAULT_CONFIG_PATHS = [
@@ -24,6 +25,11 @@ strict_cached_enclosures = yes
 rss_poll_seconds = 900
 retry_backoff_seconds = 300
 max_bytes_per_show = 0
+max_concurrent_fetches = 2
+bytes_per_sync = 1048576
+rss_rebuild_debounce_ms = 500
+max_concurrent_refreshes = 4
+min_free_bytes = 104857600
 public_host =
 starter_pack_installed = no
 starter_pack_prompted = no
@@ -63,6 +69,22 @@ class NomadCastConfig:
     reticulum_destination_app: str
     reticulum_destination_aspects: tuple[str, ...]
     config_path: Path
+    max_concurrent_fetches: int = 2
+    bytes_per_sync: int = 1048576
+    rss_rebuild_debounce_ms: int = 500
+    max_concurrent_refreshes: int = 4
+    min_free_bytes: int = 104857600
+
+    @cached_property
+    def resolved_public_host(self) -> str:
+        """Host advertised in local feed and media URLs.
+
+        README: when binding to 0.0.0.0, rewrite to 127.0.0.1 unless
+        public_host is explicitly set.
+        """
+        if self.public_host:
+            return self.public_host
+        return self.listen_host if self.listen_host != "0.0.0.0" else "127.0.0.1"
 
 
 def ensure_default_config(config_path: Path) -> None:
@@ -270,6 +292,29 @@ def load_config(config_path: Path | None = None) -> NomadCastConfig:
         min_value=1,
     )
     max_bytes_per_show = _get_int_value(section, "max_bytes_per_show", 0, config_path, min_value=0)
+    max_concurrent_fetches = _get_int_value(
+        section,
+        "max_concurrent_fetches",
+        2,
+        config_path,
+        min_value=1,
+    )
+    bytes_per_sync = _get_int_value(section, "bytes_per_sync", 1048576, config_path, min_value=0)
+    rss_rebuild_debounce_ms = _get_int_value(
+        section,
+        "rss_rebuild_debounce_ms",
+        500,
+        config_path,
+        min_value=0,
+    )
+    max_concurrent_refreshes = _get_int_value(
+        section,
+        "max_concurrent_refreshes",
+        4,
+        config_path,
+        min_value=1,
+    )
+    min_free_bytes = _get_int_value(section, "min_free_bytes", 104857600, config_path, min_value=0)
     public_host = section.get("public_host", "").strip() or None
     starter_pack_installed = _parse_bool(section.get("starter_pack_installed"), False)
     starter_pack_prompted = _parse_bool(section.get("starter_pack_prompted"), False)
@@ -337,6 +382,11 @@ def load_config(config_path: Path | None = None) -> NomadCastConfig:
         reticulum_destination_app=reticulum_destination_app,
         reticulum_destination_aspects=aspects,
         config_path=config_path,
+        max_concurrent_fetches=max_concurrent_fetches,
+        bytes_per_sync=bytes_per_sync,
+        rss_rebuild_debounce_ms=rss_rebuild_debounce_ms,
+        max_concurrent_refreshes=max_concurrent_refreshes,
+        min_free_bytes=min_free_bytes,
     )
 
 
@@ -3,27 +3,38 @@ from __future__ import annotations
 """Daemon lifecycle and background refresh logic for NomadCast.
 
 This module coordinates configuration reloads, feed refreshes, and media
-downloads as described in the README. It owns the single worker thread and the
-queue used to serialize background work.
+downloads as described in the README. It owns the worker thread and queue that
+serialize background work, plus a bounded thread pool for media downloads.
 """
 
+import collections
+import functools
+import hashlib
+import heapq
 import logging
-import queue
+import os
+import random
+import shutil
+import stat
 import sys
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from enum import Enum
+from enum import IntEnum
 from pathlib import Path
+from typing import Callable, Iterable, Mapping
+from urllib.parse import unquote
 
 from nomadcastd.config import NomadCastConfig, load_config, load_subscriptions
-from nomadcastd.fetchers import Fetcher, MockFetcher, ReticulumFetcher
+from nomadcastd.fetchers import Fetcher, MockFetcher, PayloadTooLargeError, ReticulumFetcher
 from nomadcastd.parsing import (
     Subscription,
     decode_show_path,
     encode_show_path,
-    parse_nomadcast_media_url,
+    media_url_prefixes,
     parse_subscription_uri,
+    sanitize_filename,
 )
 from nomadcastd.mirroring import (
     resolve_mirroring_enabled,
@@ -31,10 +42,9 @@ from nomadcastd.mirroring import (
     write_nomadnet_index,
 )
 from nomadcastd.starter_pack import maybe_install_starter_pack
-from nomadcastd.rss import parse_rss_items, rewrite_rss
+from nomadcastd.rss import ParsedRss, feed_poll_interval, latest_items, parse_rss_items, rewrite_rss
 from nomadcastd.storage import (
     CachedEpisode,
-    cached_episode_filenames,
     ensure_show_dirs,
     load_show_state,
     save_show_state,
@@ -44,14 +54,74 @@ from nomadcastd.storage import (
     write_atomic,
 )
 
+_DEBUG = logging.DEBUG
+# Upper bound on a feed's own <ttl>/sy:updatePeriod so a "weekly" feed is
+# still checked daily.
+_MAX_FEED_POLL_SECONDS = 24 * 60 * 60
+# All shows share the storage filesystem, so one free-space reading serves
+# every media fetch started within this window.
+_FREE_SPACE_TTL_SECONDS = 5.0
+# Upper bound on threads reload_config uses to prepare show directories.
+_RELOAD_WORKERS = 16
 
-@dataclass
+
+@functools.lru_cache(maxsize=1024)
+def _show_id_from_path_cached(show_path: str) -> str | None:
+    """Decode a show_path into its show_id, returning None for invalid input.
+
+    HTTP clients request the same few show paths repeatedly, so results are
+    memoized. reload_config clears the cache.
+    """
+    try:
+        destination_hash, show_name = decode_show_path(show_path)
+    except ValueError:
+        return None
+    return f"{destination_hash}:{show_name}"
+
+
+def _open_regular_file(path: str) -> tuple[int, int] | None:
+    """Open path read-only, returning (fd, size) or None if it is not a file."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except FileNotFoundError:
+        return None
+    info = os.fstat(fd)
+    if not stat.S_ISREG(info.st_mode):
+        os.close(fd)
+        return None
+    return fd, info.st_size
+
+
+@dataclass(slots=True)
 class ShowContext:
     """Per-show state tracked by the daemon worker.
 
-    Attributes are mutated from the main thread and worker thread; access is
-    guarded by the instance lock. The context persists storage paths and
-    metadata used to rebuild client RSS feeds.
+    Attributes are mutated from the main thread, worker thread, and thread pools;
+    access is guarded by the instance lock, rss_lock serializes client RSS
+    rebuilds for the show, and refresh_lock keeps refreshes of the show from
+    overlapping on the refresh pool. The context persists storage paths and
+    metadata used to rebuild client RSS feeds. cached_total_bytes is a
+    running total of state.cached_episodes sizes so eviction checks do not
+    need to rescan the cache. state_dirty marks in-memory state changes that
+    have not yet been written to state.json. publisher_rss_bytes keeps the
+    last fetched feed in memory and publisher_rss_parsed holds refresh's
+    parse of it until the next client RSS rewrite consumes it.
+    last_client_rss_fp records the inputs of the last client RSS rewrite so
+    unchanged rebuilds can be skipped. scan_changes collects filenames
+    promoted or evicted while a refresh reconciles the episodes directory
+    outside the lock, and is None when no reconcile is running.
+    encoded_show_path is the HTTP show_path segment derived from the
+    subscription, and media_url_prefixes are the enclosure URL prefixes that
+    identify this show's media. show_dir_str and episodes_dir_str are string
+    forms of the storage paths used by os.path calls on hot paths.
+    order_map_key is the (feed hash, episodes_per_show) pair order_map was
+    built from, letting refresh skip reparsing an unchanged feed.
+    publish_timer is the pending debounced client RSS rebuild, if any, and
+    rng draws the show's retry jitter independently of other shows.
+    next_refresh_monotonic and last_refresh_monotonic are time.monotonic()
+    readings for the backoff deadline and the last successful refresh, so
+    polling decisions survive wall-clock steps; last_refresh_monotonic is
+    seeded from the persisted state.last_refresh.
     """
     subscription: Subscription
     show_dir: Path
@@ -60,21 +130,56 @@ class ShowContext:
     state_path: Path
     state: ShowState
     lock: threading.Lock = field(default_factory=threading.Lock)
+    rss_lock: threading.Lock = field(default_factory=threading.Lock)
+    refresh_lock: threading.Lock = field(default_factory=threading.Lock)
     refresh_pending: bool = False
     media_pending: set[str] = field(default_factory=set)
-    next_refresh_time: float = 0.0
+    next_refresh_monotonic: float = 0.0
+    last_refresh_monotonic: float | None = field(init=False, default=None)
     order_map: dict[str, int] = field(default_factory=dict)
+    order_map_key: tuple[str, int] | None = None
+    cached_total_bytes: int = field(init=False, default=0)
+    state_dirty: bool = False
+    publisher_rss_bytes: bytes | None = None
+    publisher_rss_parsed: ParsedRss | None = None
+    last_client_rss_fp: tuple[object, ...] | None = None
+    encoded_show_path: str = field(init=False, default="")
+    media_url_prefixes: tuple[str, ...] = field(init=False, default=())
+    show_dir_str: str = field(init=False, default="")
+    episodes_dir_str: str = field(init=False, default="")
+    publish_timer: threading.Timer | None = None
+    scan_changes: set[str] | None = None
+    rng: random.Random = field(default_factory=random.Random)
+
+    def __post_init__(self) -> None:
+        self.show_dir_str = os.fspath(self.show_dir)
+        self.episodes_dir_str = os.fspath(self.episodes_dir)
+        self.encoded_show_path = encode_show_path(
+            self.subscription.destination_hash,
+            self.subscription.show_name,
+        )
+        self.media_url_prefixes = media_url_prefixes(
+            self.subscription.destination_hash,
+            self.subscription.show_name,
+        )
+        self.cached_total_bytes = sum(item.size_bytes for item in self.state.cached_episodes.values())
+        if self.state.last_refresh:
+            age = max(0.0, time.time() - self.state.last_refresh)
+            self.last_refresh_monotonic = time.monotonic() - age
 
 
-class JobType(Enum):
-    """Types of background work handled by the daemon worker thread."""
+class JobType(IntEnum):
+    """Types of background work handled by the daemon worker thread.
 
-    STOP = "stop"
-    REFRESH = "refresh"
-    MEDIA = "media"
+    An IntEnum so the per-job dispatch table lookup hashes a plain int.
+    """
+
+    STOP = 0
+    MEDIA = 1
+    MEDIA_BATCH = 2
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DaemonJob:
     """Queue item describing a unit of background work.
 
@@ -82,21 +187,23 @@ class DaemonJob:
         type: The kind of work to perform.
         show_id: The "<destination_hash>:<show_name>" identifier for the show.
         payload: Optional job-specific payload. For media jobs, this is the
-            episode filename to download; otherwise None.
+            episode filename to download; for media batch jobs, a tuple of
+            filenames; otherwise None.
     """
 
     type: JobType
     show_id: str
-    payload: str | None = None
+    payload: str | tuple[str, ...] | None = None
 
 
 class NomadCastDaemon:
     """Manage NomadCast background work and cached storage.
 
-    The daemon owns a single worker thread and an in-process queue to serialize
-    refresh and media fetch jobs. Callers may enqueue work from multiple
-    threads; internal locking on ShowContext ensures per-show state remains
-    consistent.
+    The daemon owns a single worker thread and an in-process job queue. The
+    worker hands media jobs to a pool bounded by max_concurrent_fetches;
+    refreshes skip the queue and go straight to a pool bounded by
+    max_concurrent_refreshes. Callers may enqueue work from multiple threads;
+    internal locking on ShowContext ensures per-show state remains consistent.
     """
     def __init__(
         self,
@@ -116,14 +223,17 @@ class NomadCastDaemon:
                 directory.
 
         Side Effects:
-            Loads configuration, constructs the worker thread, and allocates
-            the in-memory queue. Does not touch the filesystem until start().
+            Loads configuration, constructs the worker thread and thread pools,
+            and allocates the in-memory queue. Does not touch the filesystem
+            until start().
 
         Thread Safety:
             Safe to call from the main thread before start() is invoked.
         """
         # README: daemon bridges Reticulum-hosted feeds to local HTTP.
         self.logger = logging.getLogger("nomadcastd")
+        # Bound once so hot-path debug logging costs a single cached check.
+        self._dbg = self.logger.isEnabledFor
         self.config = config or load_config()
         self.logger.debug("Daemon config loaded: %s", self.config)
         if fetcher is not None:
@@ -142,14 +252,35 @@ class NomadCastDaemon:
                     exc,
                 )
                 self.fetcher = MockFetcher()
-        self.show_contexts: dict[str, ShowContext] = {}
+        # Read-only snapshot: reload_config swaps in a new mapping and never
+        # mutates a published one, so readers need no lock.
+        self.show_contexts: Mapping[str, ShowContext] = {}
         self.subscriptions: list[Subscription] = []
-        self.queue: queue.Queue[DaemonJob] = queue.Queue()
+        # Jobs are a deque guarded by a condition so the idle worker blocks
+        # instead of polling.
+        self._jobs: collections.deque[DaemonJob] = collections.deque()
+        self._cv = threading.Condition()
         self.stop_event = threading.Event()
         self.worker_thread = threading.Thread(target=self._worker_loop, daemon=True)
+        self._refresh_pool = ThreadPoolExecutor(
+            max_workers=self.config.max_concurrent_refreshes,
+            thread_name_prefix="nomadcast-refresh",
+        )
+        self._media_pool = ThreadPoolExecutor(
+            max_workers=self.config.max_concurrent_fetches,
+            thread_name_prefix="nomadcast-media",
+        )
+        # Serializes NomadNet mirror/index writes shared by all shows.
+        self._mirror_lock = threading.Lock()
+        # (monotonic timestamp, free bytes) of the last storage_path reading.
+        self._free_space: tuple[float, int] | None = None
         self.default_mirroring_enabled = True
         self.starter_pack_force = starter_pack_force
         self.starter_pack_pages_path = starter_pack_pages_path
+        self._dispatch: dict[JobType, Callable[[DaemonJob], None]] = {
+            JobType.MEDIA: self._dispatch_media,
+            JobType.MEDIA_BATCH: self._dispatch_media_batch,
+        }
 
     def start(self) -> None:
         """Start the daemon worker and ensure storage exists.
@@ -190,16 +321,25 @@ class NomadCastDaemon:
         """Stop the daemon worker and wait briefly for exit.
 
         Side Effects:
-            Signals the worker thread, enqueues a sentinel job, and joins the
-            thread with a short timeout.
+            Signals the worker thread, enqueues a sentinel job, cancels queued
+            refreshes and media downloads, joins the thread with a short timeout, runs any
+            debounced RSS rebuilds, flushes any dirty show state, and closes the
+            fetcher's cached links. Fetches still running then fail, but are
+            not recorded as show failures because stop_event is set.
 
         Thread Safety:
             Safe to call from the main thread; no guarantee of immediate
             shutdown if background work is blocked.
         """
         self.stop_event.set()
-        self.queue.put(DaemonJob(JobType.STOP, ""))
+        self._put_job(DaemonJob(JobType.STOP, ""))
+        self._refresh_pool.shutdown(wait=False, cancel_futures=True)
+        self._media_pool.shutdown(wait=False, cancel_futures=True)
         self.worker_thread.join(timeout=5)
+        for context in self.show_contexts.values():
+            self._flush_pending_publish(context)
+            self._flush_if_dirty(context)
+        self.fetcher.close()
         self.logger.debug("Daemon stop complete")
 
     def reload_config(self) -> None:
@@ -207,15 +347,20 @@ class NomadCastDaemon:
 
         Inputs/Outputs:
             Reads config and subscription files as defined by NomadCastConfig
-            and updates self.show_contexts with new ShowContext instances.
+            and publishes a new self.show_contexts snapshot, reusing existing
+            ShowContext instances for subscriptions that are still present.
 
         Side Effects:
             Ensures per-show storage directories exist and loads cached
             show state from disk. Invalid subscriptions are logged and skipped.
 
         Thread Safety:
-            Should be called from the main thread or while the worker is idle;
-            per-context locks protect concurrent updates to ShowContext fields.
+            Safe to call while the refresh and media pools are running.
+            Per-show directory and state.json IO runs on a short-lived thread
+            pool; existing contexts are flushed, reloaded, and updated under
+            their own lock there, and the new show_contexts mapping is
+            published on the calling thread. Concurrent reload_config calls
+            are not serialized.
         """
         # Reload config and subscriptions (README: POST /reload triggers this).
         self.config = load_config(self.config.config_path)
@@ -230,25 +375,26 @@ class NomadCastDaemon:
                 self.logger.warning("Skipping invalid subscription %s: %s", uri, exc)
 
         self.subscriptions = subscriptions
+        _show_id_from_path_cached.cache_clear()
+        current_contexts = self.show_contexts
+        existing = [current_contexts.get(subscription.show_id) for subscription in subscriptions]
+        if len(subscriptions) > 1:
+            # Cold-cache mkdir and state.json reads dominate reload time, so
+            # overlap them across shows.
+            workers = min(_RELOAD_WORKERS, len(subscriptions))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="nomadcast-reload") as pool:
+                prepared = list(pool.map(self._prepare_show, subscriptions, existing))
+        else:
+            prepared = [self._prepare_show(sub, ctx) for sub, ctx in zip(subscriptions, existing)]
         new_contexts: dict[str, ShowContext] = {}
         # Build show contexts keyed by destination_hash:show_name (README:
         # destination hash is authoritative; show name is cosmetic but part
         # of routing).
-        for subscription in subscriptions:
+        for subscription, context, (show_dir, dirs, state_path, state) in zip(subscriptions, existing, prepared):
             show_id = subscription.show_id
-            show_dir = show_directory(self.config.storage_path, subscription.destination_hash)
-            dirs: ShowDirs = ensure_show_dirs(show_dir)
-            state_path = show_dir / "state.json"
-            state = load_show_state(state_path, subscription.uri, subscription.show_name)
-            context = self.show_contexts.get(show_id)
             if context:
-                self.logger.debug("Updating existing context for %s", show_id)
-                context.subscription = subscription
-                context.show_dir = show_dir
-                context.episodes_dir = dirs["episodes_dir"]
-                context.tmp_dir = dirs["tmp_dir"]
-                context.state_path = state_path
-                context.state = state
+                # _prepare_show already updated it under its lock.
+                self.logger.debug("Updated existing context for %s", show_id)
                 new_contexts[show_id] = context
             else:
                 self.logger.debug("Creating new context for %s", show_id)
@@ -262,68 +408,144 @@ class NomadCastDaemon:
                 )
         self.show_contexts = new_contexts
         self.logger.info("Loaded %d subscription(s)", len(subscriptions))
-        write_nomadnet_index(
-            self.config,
-            self.subscriptions,
-            default_mirroring_enabled=self.default_mirroring_enabled,
-        )
+        with self._mirror_lock:
+            write_nomadnet_index(
+                self.config,
+                self.subscriptions,
+                default_mirroring_enabled=self.default_mirroring_enabled,
+            )
+
+    def _prepare_show(
+        self,
+        subscription: Subscription,
+        context: ShowContext | None,
+    ) -> tuple[Path, ShowDirs, Path, ShowState]:
+        """Create a show's directories and load its state for reload_config.
+
+        Inputs:
+            subscription: Subscription being (re)loaded.
+            context: The show's current context, if it already exists.
+
+        Outputs:
+            (show_dir, dirs, state_path, state) for building the show's
+            context.
+
+        Side Effects:
+            Creates missing show directories. An existing context has its
+            dirty state flushed, is pointed at the new paths and subscription,
+            and takes the reloaded state.
+
+        Thread Safety:
+            Safe to run on pool threads; touches only this show's files. For
+            an existing context the flush, reload, and swap happen under its
+            lock, so promotions and evictions from the media pool are either
+            flushed first or applied to the reloaded state.
+        """
+        show_dir = show_directory(self.config.storage_path, subscription.destination_hash)
+        dirs = ensure_show_dirs(show_dir)
+        state_path = show_dir / "state.json"
+        if not context:
+            return show_dir, dirs, state_path, load_show_state(state_path, subscription.uri, subscription.show_name)
+        with context.lock:
+            # Persist unsaved changes before state.json is read back.
+            if context.state_dirty:
+                save_show_state(context.state_path, context.state)
+                context.state_dirty = False
+            state = load_show_state(state_path, subscription.uri, subscription.show_name)
+            context.subscription = subscription
+            context.show_dir = show_dir
+            context.episodes_dir = dirs["episodes_dir"]
+            context.show_dir_str = os.fspath(show_dir)
+            context.episodes_dir_str = os.fspath(dirs["episodes_dir"])
+            context.tmp_dir = dirs["tmp_dir"]
+            context.state_path = state_path
+            context.state = state
+            context.cached_total_bytes = sum(item.size_bytes for item in state.cached_episodes.values())
+        return show_dir, dirs, state_path, state
 
     def enqueue_refresh(self, show_id: str, *, force: bool = False) -> None:
         """Request an RSS refresh for a show.
 
         Queue Semantics:
-            Debounces duplicate refreshes and honors rss_poll_seconds as well
-            as the exponential backoff derived from retry_backoff_seconds. Only
-            one pending refresh per show is queued at a time.
+            Debounces duplicate refreshes and honors rss_poll_seconds (or the
+            feed's own longer <ttl>/sy:updatePeriod) as well as the
+            exponential backoff derived from retry_backoff_seconds. Only one
+            pending refresh per show is queued at a time; refresh_pending is
+            that single slot, so refreshes bypass the worker queue and are
+            submitted directly to the refresh pool.
 
         Side Effects:
-            Enqueues a refresh job for the worker thread when eligible.
+            Submits a refresh to the refresh pool when eligible.
 
         Thread Safety:
-            Safe to call concurrently; uses per-show lock to update flags.
+            Safe to call concurrently. A pending refresh is detected with an
+            unlocked read of refresh_pending; a stale read only falls through
+            to the locked check, which is authoritative.
         """
         context = self.show_contexts.get(show_id)
         if not context:
             self.logger.debug("Refresh requested for unknown show_id=%s", show_id)
             return
+        if context.refresh_pending:
+            return
         with context.lock:
-            now = time.time()
+            now = time.monotonic()
             # Debounce refresh requests and honor RSS polling interval
             # (README: rss_poll_seconds, backoff behavior).
             if context.refresh_pending:
-                self.logger.debug("Refresh already pending for %s", show_id)
+                if self._dbg(_DEBUG):
+                    self.logger.debug("Refresh already pending for %s", show_id)
                 return
             if not force:
-                if context.state.last_refresh and now - context.state.last_refresh < self.config.rss_poll_seconds:
-                    self.logger.debug(
-                        "Refresh skipped for %s: last_refresh=%s rss_poll_seconds=%s",
-                        show_id,
-                        context.state.last_refresh,
-                        self.config.rss_poll_seconds,
-                    )
+                poll_seconds = max(self.config.rss_poll_seconds, context.state.feed_poll_seconds)
+                last_refresh = context.last_refresh_monotonic
+                if last_refresh is not None and now - last_refresh < poll_seconds:
+                    if self._dbg(_DEBUG):
+                        self.logger.debug(
+                            "Refresh skipped for %s: last_refresh=%s poll_seconds=%s",
+                            show_id,
+                            context.state.last_refresh,
+                            poll_seconds,
+                        )
                     return
-                if now < context.next_refresh_time:
-                    self.logger.debug(
-                        "Refresh backoff active for %s: next_refresh_time=%s now=%s",
-                        show_id,
-                        context.next_refresh_time,
-                        now,
-                    )
+                if now < context.next_refresh_monotonic:
+                    if self._dbg(_DEBUG):
+                        self.logger.debug(
+                            "Refresh backoff active for %s: retry in %.0fs",
+                            show_id,
+                            context.next_refresh_monotonic - now,
+                        )
                     return
             context.refresh_pending = True
+        try:
+            self._refresh_pool.submit(self._run_refresh, show_id)
+        except RuntimeError:
+            # The pool is shut down once stop() begins.
+            with context.lock:
+                context.refresh_pending = False
+            self.logger.debug("Refresh for %s dropped: daemon stopping", show_id)
+            return
         if force:
             self.logger.info("Enqueued startup refresh for %s", show_id)
-        else:
+        elif self._dbg(_DEBUG):
             self.logger.debug("Enqueued refresh for %s", show_id)
-        self.queue.put(DaemonJob(JobType.REFRESH, show_id))
 
     def _queue_initial_refreshes(self) -> None:
-        """Queue immediate refreshes for all shows on startup."""
-        if not self.show_contexts:
+        """Queue immediate refreshes for all shows on startup.
+
+        Side Effects:
+            Asks the fetcher to prewarm every subscribed destination first, so
+            path lookups overlap instead of waiting for a refresh worker.
+        """
+        contexts = self.show_contexts
+        if not contexts:
             self.logger.info("No subscriptions to refresh on startup.")
             return
-        self.logger.info("Starting initial sync for %d subscription(s).", len(self.show_contexts))
-        for show_id in self.show_contexts:
+        self.logger.info("Starting initial sync for %d subscription(s).", len(contexts))
+        self.fetcher.prewarm(
+            {context.subscription.destination_hash for context in contexts.values()}
+        )
+        for show_id in contexts:
             self.enqueue_refresh(show_id, force=True)
 
     def enqueue_media_fetch(self, show_id: str, filename: str) -> None:
@@ -345,51 +567,83 @@ class NomadCastDaemon:
             return
         with context.lock:
             if filename in context.media_pending:
-                self.logger.debug("Media fetch already pending for %s/%s", show_id, filename)
+                if self._dbg(_DEBUG):
+                    self.logger.debug("Media fetch already pending for %s/%s", show_id, filename)
                 return
             context.media_pending.add(filename)
-        self.logger.debug("Enqueued media fetch for %s/%s", show_id, filename)
-        self.queue.put(DaemonJob(JobType.MEDIA, show_id, filename))
+        if self._dbg(_DEBUG):
+            self.logger.debug("Enqueued media fetch for %s/%s", show_id, filename)
+        self._put_job(DaemonJob(JobType.MEDIA, show_id, filename))
 
-    def get_cached_rss(self, show_id: str) -> bytes | None:
-        """Return cached client RSS bytes for a show, if present.
+    def _enqueue_media_batch(self, show_id: str, filenames: list[str]) -> None:
+        """Request media fetches for several filenames of one show at once.
+
+        Queue Semantics:
+            Same de-duplication as enqueue_media_fetch, but admits the whole
+            batch under a single per-show lock acquisition and queues it as
+            one MEDIA_BATCH job.
+        """
+        context = self.show_contexts.get(show_id)
+        if not context or not filenames:
+            return
+        new_filenames: list[str] = []
+        with context.lock:
+            for filename in filenames:
+                if filename in context.media_pending:
+                    if self._dbg(_DEBUG):
+                        self.logger.debug("Media fetch already pending for %s/%s", show_id, filename)
+                    continue
+                context.media_pending.add(filename)
+                new_filenames.append(filename)
+        if not new_filenames:
+            return
+        if self._dbg(_DEBUG):
+            self.logger.debug("Enqueued %d media fetch(es) for %s", len(new_filenames), show_id)
+        self._put_job(DaemonJob(JobType.MEDIA_BATCH, show_id, tuple(new_filenames)))
+
+    def get_cached_rss_fd(self, show_id: str) -> tuple[int, int] | None:
+        """Open the cached client RSS for serving.
 
         Outputs:
-            The contents of client_rss.xml or None if no cached feed exists.
+            (fd, size_bytes) for client_rss.xml opened read-only, or None if no
+            cached feed exists. The caller owns the descriptor and must close
+            it.
 
         Thread Safety:
-            File reads are safe; no locks required.
+            No locks required; client_rss.xml is replaced by rename, so an open
+            descriptor always sees one complete feed.
         """
         context = self.show_contexts.get(show_id)
         if not context:
-            self.logger.debug("No context for cached RSS lookup for %s", show_id)
+            if self._dbg(_DEBUG):
+                self.logger.debug("No context for cached RSS lookup for %s", show_id)
             return None
-        rss_path = context.show_dir / "client_rss.xml"
-        if rss_path.exists():
-            self.logger.debug("Serving cached RSS for %s", show_id)
-            return rss_path.read_bytes()
-        self.logger.debug("Cached RSS missing for %s", show_id)
-        return None
+        opened = _open_regular_file(os.path.join(context.show_dir_str, "client_rss.xml"))
+        if opened is None and self._dbg(_DEBUG):
+            self.logger.debug("Cached RSS missing for %s", show_id)
+        return opened
 
-    def get_media_path(self, show_id: str, filename: str) -> Path | None:
-        """Return the cached media file path when present.
+    def get_media_fd(self, show_id: str, filename: str) -> tuple[int, int] | None:
+        """Open cached media for serving.
 
         Outputs:
-            A Path pointing at episodes/<filename> if it exists, otherwise None.
+            (fd, size_bytes) for episodes/<filename> opened read-only, or None
+            when the file is not cached. The caller owns the descriptor and
+            must close it.
 
         Thread Safety:
-            File existence checks are safe; no locks required.
+            No locks required; the open descriptor stays valid even if the
+            file is evicted or replaced while it is being served.
         """
         context = self.show_contexts.get(show_id)
         if not context:
-            self.logger.debug("No context for media lookup for %s/%s", show_id, filename)
+            if self._dbg(_DEBUG):
+                self.logger.debug("No context for media lookup for %s/%s", show_id, filename)
             return None
-        candidate = context.episodes_dir / filename
-        if candidate.exists():
-            self.logger.debug("Serving cached media for %s/%s", show_id, filename)
-            return candidate
-        self.logger.debug("Cached media missing for %s/%s", show_id, filename)
-        return None
+        opened = _open_regular_file(os.path.join(context.episodes_dir_str, filename))
+        if opened is None and self._dbg(_DEBUG):
+            self.logger.debug("Cached media missing for %s/%s", show_id, filename)
+        return opened
 
     def show_id_from_path(self, show_path: str) -> str | None:
         """Convert a URL path segment into the internal show_id.
@@ -404,39 +658,70 @@ class NomadCastDaemon:
         Error Conditions:
             Returns None if decoding fails.
         """
-        try:
-            destination_hash, show_name = decode_show_path(show_path)
-        except ValueError:
-            return None
-        return f"{destination_hash}:{show_name}"
+        return _show_id_from_path_cached(show_path)
+
+    def _put_job(self, job: DaemonJob) -> None:
+        """Append a job to the worker queue and wake the worker."""
+        with self._cv:
+            self._jobs.append(job)
+            self._cv.notify()
 
     def _worker_loop(self) -> None:
         """Process queued jobs until stopped.
 
         Queue Semantics:
-            Processes jobs in FIFO order. STOP jobs terminate the loop; REFRESH
-            jobs fetch RSS, and MEDIA jobs download episode files.
+            Processes jobs in FIFO order, blocking on the queue condition while
+            idle. STOP jobs terminate the loop; MEDIA and MEDIA_BATCH jobs are
+            submitted to the media pool.
 
         Thread Safety:
             Runs on the dedicated worker thread only.
         """
         while not self.stop_event.is_set():
+            with self._cv:
+                while not self._jobs and not self.stop_event.is_set():
+                    self._cv.wait()
+                if not self._jobs:
+                    continue
+                job = self._jobs.popleft()
+            if job.type is JobType.STOP:
+                self.logger.debug("Worker loop received stop signal")
+                return
+            self._dispatch[job.type](job)
+
+    def _run_refresh(self, show_id: str) -> None:
+        """Refresh a show on a refresh pool thread, one refresh per show."""
+        context = self.show_contexts.get(show_id)
+        if not context:
+            self.logger.debug("Refresh skipped: missing context for %s", show_id)
+            return
+        with context.refresh_lock:
+            self._handle_refresh(show_id)
+
+    def _dispatch_media(self, job: DaemonJob) -> None:
+        """Submit a MEDIA job to the media pool."""
+        filename = job.payload
+        if filename:
+            if self._dbg(_DEBUG):
+                self.logger.debug("Worker dispatching media for %s/%s", job.show_id, filename)
+            self._submit_media(job.show_id, (filename,))
+
+    def _dispatch_media_batch(self, job: DaemonJob) -> None:
+        """Submit every filename of a MEDIA_BATCH job to the media pool."""
+        filenames = job.payload or ()
+        if self._dbg(_DEBUG):
+            self.logger.debug("Worker dispatching %d media fetch(es) for %s", len(filenames), job.show_id)
+        self._submit_media(job.show_id, filenames)
+
+    def _submit_media(self, show_id: str, filenames: Iterable[str]) -> None:
+        """Submit media fetches to the media pool, dropping them once stopping."""
+        for filename in filenames:
             try:
-                job = self.queue.get(timeout=0.2)
-            except queue.Empty:
-                continue
-            match job.type:
-                case JobType.STOP:
-                    self.logger.debug("Worker loop received stop signal")
-                    return
-                case JobType.REFRESH:
-                    self.logger.debug("Worker handling refresh for %s", job.show_id)
-                    self._handle_refresh(job.show_id)
-                case JobType.MEDIA:
-                    filename = job.payload
-                    if filename:
-                        self.logger.debug("Worker handling media for %s/%s", job.show_id, filename)
-                        self._handle_media_fetch(job.show_id, filename)
+                self._media_pool.submit(self._handle_media_fetch, show_id, filename)
+            except RuntimeError:
+                # The pool is shut down once stop() begins.
+                self.logger.debug("Media fetch for %s dropped: daemon stopping", show_id)
+                return
 
     def _handle_refresh(self, show_id: str) -> None:
         """Fetch the publisher RSS, update cache, and queue media downloads.
@@ -452,10 +737,12 @@ class NomadCastDaemon:
 
         Error Conditions:
             Any exception from fetch, parsing, or file IO records a failure and
-            schedules backoff according to retry_backoff_seconds.
+            schedules backoff according to retry_backoff_seconds, unless the
+            daemon is stopping.
 
         Thread Safety:
-            Runs on the worker thread; updates shared state under lock.
+            Runs on a refresh pool thread while holding context.refresh_lock;
+            updates shared state under the per-show lock.
         """
         context = self.show_contexts.get(show_id)
         if not context:
@@ -477,56 +764,82 @@ class NomadCastDaemon:
             self.logger.debug("Fetching RSS for %s at %s", show_id, rss_path)
             rss_bytes = self.fetcher.fetch_bytes(context.subscription.destination_hash, rss_path)
             self.logger.info("Fetched RSS for %s (%d bytes)", show_id, len(rss_bytes))
-            write_atomic(context.show_dir / "publisher_rss.xml", rss_bytes)
-            _, items = parse_rss_items(rss_bytes)
-            self.logger.info("Parsed %d RSS items for %s", len(items), show_id)
-            ordered_items = items
-            if any(item.pub_date is not None for item in items):
-                ordered_items = sorted(
-                    items,
-                    key=lambda item: item.pub_date if item.pub_date is not None else 0,
-                    reverse=True,
-                )
-            selected_items = ordered_items[: self.config.episodes_per_show]
-            self.logger.info(
-                "Selected %d item(s) for %s (episodes_per_show=%s)",
-                len(selected_items),
-                show_id,
-                self.config.episodes_per_show,
+            rss_hash = hashlib.blake2b(memoryview(rss_bytes), digest_size=16).hexdigest()
+            publisher_path = os.path.join(context.show_dir_str, "publisher_rss.xml")
+            try:
+                on_disk_len = os.path.getsize(publisher_path)
+            except FileNotFoundError:
+                on_disk_len = -1
+            # The size check also catches a feed truncated by a crash, since
+            # the regenerable RSS files are written without fsync.
+            rss_unchanged = (
+                len(rss_bytes) == context.state.last_rss_len == on_disk_len
+                and rss_hash == context.state.last_rss_hash
             )
-            order_map: dict[str, int] = {}
+            if rss_unchanged:
+                self.logger.debug("Publisher RSS unchanged for %s; skipping write", show_id)
+            else:
+                write_atomic(Path(publisher_path), rss_bytes, durable=False)
+            selection_key = (rss_hash, self.config.episodes_per_show)
+            if rss_unchanged and context.order_map_key == selection_key:
+                # Same feed and selection as the last refresh: skip the parse.
+                self.logger.debug("Reusing episode selection for %s", show_id)
+                parsed = None
+                order_map = context.order_map
+                feed_poll_seconds = context.state.feed_poll_seconds
+            else:
+                parsed, order_map, feed_poll_seconds = self._select_episodes(context, rss_bytes)
+            missing_filenames: list[str] = []
             # README: queue downloads for the most recent N episodes.
-            for index, item in enumerate(selected_items):
-                for url in item.enclosure_urls:
-                    try:
-                        dest_hash, show_name, filename = parse_nomadcast_media_url(url)
-                    except ValueError:
-                        self.logger.debug("Skipping non-nomadcast enclosure URL: %s", url)
-                        continue
-                    if dest_hash != context.subscription.destination_hash or show_name != context.subscription.show_name:
-                        self.logger.debug(
-                            "Skipping enclosure for %s: dest=%s show=%s",
-                            show_id,
-                            dest_hash,
-                            show_name,
-                        )
-                        continue
-                    order_map[filename] = index
-                    if not (context.episodes_dir / filename).exists():
-                        self.logger.info(
-                            "Queueing media fetch show_id=%s filename=%s order_index=%s",
-                            show_id,
-                            filename,
-                            index,
-                        )
-                        self.enqueue_media_fetch(show_id, filename)
+            for filename, index in order_map.items():
+                if not os.path.exists(os.path.join(context.episodes_dir_str, filename)):
+                    self.logger.info(
+                        "Queueing media fetch show_id=%s filename=%s order_index=%s",
+                        show_id,
+                        filename,
+                        index,
+                    )
+                    missing_filenames.append(filename)
+            self._enqueue_media_batch(show_id, missing_filenames)
+            # Reconcile the episodes directory before taking the lock so
+            # enqueue calls from HTTP handlers never wait on disk I/O.
             with context.lock:
+                context.scan_changes = set()
+            try:
+                cached = self._load_cached_episodes(context, order_map)
+            except Exception:
+                with context.lock:
+                    context.scan_changes = None
+                raise
+            with context.lock:
+                # The media pool's promotions and evictions since the scan
+                # are already reflected in state and win over the scan.
+                for filename in context.scan_changes:
+                    episode = context.state.cached_episodes.get(filename)
+                    if episode is None or filename not in order_map:
+                        cached.pop(filename, None)
+                    else:
+                        cached[filename] = CachedEpisode(
+                            filename=filename,
+                            order_index=order_map[filename],
+                            size_bytes=episode.size_bytes,
+                        )
+                context.scan_changes = None
                 context.order_map = order_map
+                context.order_map_key = selection_key
                 context.state.last_refresh = time.time()
+                context.last_refresh_monotonic = time.monotonic()
                 context.state.last_error = None
                 context.state.failure_count = 0
-                context.state.cached_episodes = self._load_cached_episodes(context, order_map)
-                save_show_state(context.state_path, context.state)
+                context.state.last_backoff = 0.0
+                context.state.last_rss_hash = rss_hash
+                context.state.last_rss_len = len(rss_bytes)
+                context.state.feed_poll_seconds = feed_poll_seconds
+                context.publisher_rss_bytes = rss_bytes
+                context.publisher_rss_parsed = parsed
+                context.state.cached_episodes = cached
+                context.cached_total_bytes = sum(item.size_bytes for item in cached.values())
+                context.state_dirty = True
             self.logger.info(
                 "Refresh updated state for %s: cached=%d order_map=%d",
                 show_id,
@@ -534,23 +847,59 @@ class NomadCastDaemon:
                 len(order_map),
             )
             # Rebuild client RSS after refresh per README rewrite rules.
-            self._rebuild_client_rss(context)
-            sync_nomadnet_mirror(
-                self.config,
-                context.subscription,
-                default_mirroring_enabled=self.default_mirroring_enabled,
-            )
-            write_nomadnet_index(
-                self.config,
-                self.subscriptions,
-                default_mirroring_enabled=self.default_mirroring_enabled,
-            )
+            self._publish_show(context)
             self.logger.info("Refreshed RSS for %s", show_id)
         except Exception as exc:
-            self._register_failure(context, str(exc))
-            self.logger.error("Failed to refresh %s: %s", show_id, exc)
+            if self.stop_event.is_set():
+                # stop() closed the fetcher under this refresh; not a show failure.
+                self.logger.debug("Refresh of %s interrupted by shutdown: %s", show_id, exc)
+            else:
+                self._register_failure(context, str(exc))
+                self.logger.error("Failed to refresh %s: %s", show_id, exc)
+        finally:
+            self._flush_if_dirty(context)
 
-    def _load_cached_episodes(self, context: ShowContext, order_map: dict[str, int]) -> list[CachedEpisode]:
+    def _select_episodes(self, context: ShowContext, rss_bytes: bytes) -> tuple[ParsedRss, dict[str, int], int]:
+        """Parse a publisher feed and pick the episodes to cache.
+
+        Outputs:
+            The parse_rss_items result, a mapping of media filename to order
+            index for the newest episodes_per_show items, and the feed's own
+            poll interval in seconds (0 when it declares none).
+        """
+        show_id = context.subscription.show_id
+        parsed = parse_rss_items(rss_bytes)
+        tree, items, has_pub_dates = parsed
+        feed_poll_seconds = min(feed_poll_interval(tree) or 0, _MAX_FEED_POLL_SECONDS)
+        self.logger.info("Parsed %d RSS items for %s", len(items), show_id)
+        selected_items = latest_items(items, has_pub_dates, self.config.episodes_per_show)
+        self.logger.info(
+            "Selected %d item(s) for %s (episodes_per_show=%s)",
+            len(selected_items),
+            show_id,
+            self.config.episodes_per_show,
+        )
+        order_map: dict[str, int] = {}
+        for index, item in enumerate(selected_items):
+            for url in item.enclosure_urls:
+                # Cheap prefix check first: feeds often carry artwork and
+                # other URLs that are not this show's nomadcast media.
+                for prefix in context.media_url_prefixes:
+                    if url.startswith(prefix):
+                        break
+                else:
+                    if self._dbg(_DEBUG):
+                        self.logger.debug("Skipping enclosure for %s: not show media: %s", show_id, url)
+                    continue
+                filename = unquote(url[len(prefix) :])
+                if not sanitize_filename(filename):
+                    if self._dbg(_DEBUG):
+                        self.logger.debug("Skipping enclosure for %s: invalid filename in %s", show_id, url)
+                    continue
+                order_map[filename] = index
+        return parsed, order_map, feed_poll_seconds
+
+    def _load_cached_episodes(self, context: ShowContext, order_map: dict[str, int]) -> dict[str, CachedEpisode]:
         """Reconcile cached media with the refreshed order map.
 
         Side Effects:
@@ -558,26 +907,48 @@ class NomadCastDaemon:
             only the newest episodes_per_show items per README).
 
         Outputs:
-            A list of CachedEpisode metadata for existing files.
+            A mapping of filename to CachedEpisode metadata for existing files.
+
+        Thread Safety:
+            Touches only the filesystem and its arguments; call it without
+            holding context.lock.
         """
-        cached: list[CachedEpisode] = []
+        cached: dict[str, CachedEpisode] = {}
+        # One scandir pass supplies file types and sizes for every episode.
+        with os.scandir(context.episodes_dir_str) as scan:
+            entries = {entry.name: entry for entry in scan if entry.is_file()}
         # README: only keep cached files that are still among the latest N.
-        for path in context.episodes_dir.iterdir():
-            if path.is_file() and path.name not in order_map:
-                self.logger.debug("Evicting stale media %s", path.name)
-                path.unlink()
-        for filename, order_index in order_map.items():
-            path = context.episodes_dir / filename
-            if path.exists():
-                cached.append(CachedEpisode(filename=filename, order_index=order_index, size_bytes=path.stat().st_size))
+        # The media pool may evict files concurrently, so any of them can
+        # disappear after the scan.
+        for name in entries.keys() - order_map.keys():
+            if self._dbg(_DEBUG):
+                self.logger.debug("Evicting stale media %s", name)
+            try:
+                os.unlink(entries[name].path)
+            except FileNotFoundError:
+                pass
+        for filename in entries.keys() & order_map.keys():
+            try:
+                size_bytes = entries[filename].stat().st_size
+            except FileNotFoundError:
+                continue
+            cached[filename] = CachedEpisode(
+                filename=filename,
+                order_index=order_map[filename],
+                size_bytes=size_bytes,
+            )
         return cached
 
     def _register_failure(self, context: ShowContext, message: str) -> None:
         """Record a refresh or media failure and schedule backoff.
 
         Side Effects:
-            Updates state.json with last_error and failure_count and sets the
-            next_refresh_time based on retry_backoff_seconds.
+            Updates state.json with last_error, failure_count, and last_backoff
+            and sets next_refresh_monotonic using decorrelated jitter: each backoff
+            is drawn between retry_backoff_seconds and three times the previous
+            backoff (or three times retry_backoff_seconds after a success),
+            capped at 60x retry_backoff_seconds, so shows failing in
+            the same outage do not retry in lockstep.
 
         Thread Safety:
             Uses the per-show lock to mutate shared state.
@@ -586,9 +957,14 @@ class NomadCastDaemon:
             # README: use retry_backoff_seconds with exponential-ish backoff.
             context.state.last_error = message
             context.state.failure_count += 1
-            backoff = self.config.retry_backoff_seconds * min(2 ** context.state.failure_count, 8)
-            context.next_refresh_time = time.time() + backoff
-            save_show_state(context.state_path, context.state)
+            base = self.config.retry_backoff_seconds
+            # Jitter the first retry too, so shows failing together spread out.
+            upper = max(base, (context.state.last_backoff or base) * 3)
+            backoff = min(base * 60, context.rng.uniform(base, upper))
+            context.state.last_backoff = backoff
+            context.next_refresh_monotonic = time.monotonic() + backoff
+            context.state_dirty = True
+        self._flush_if_dirty(context)
         self.logger.error(
             "Registered failure for %s: %s (failure_count=%s backoff=%s)",
             context.subscription.show_id,
@@ -601,71 +977,102 @@ class NomadCastDaemon:
         """Fetch and cache media for a show filename.
 
         Inputs/Outputs:
-            Downloads file/<show_name>/media/<filename> via the fetcher and
-            writes the media to episodes/<filename> atomically.
+            Streams file/<show_name>/media/<filename> via the fetcher into
+            tmp/<filename> and promotes it to episodes/<filename> atomically.
 
         Side Effects:
-            Updates state.json, cached episode metadata, and rebuilds the
-            client RSS with updated enclosure URLs. Enforces max_bytes_per_show
-            eviction if configured.
+            Updates state.json, cached episode metadata, and schedules a
+            debounced client RSS rebuild with updated enclosure URLs. Enforces
+            max_bytes_per_show eviction if configured.
 
         Error Conditions:
-            Any exception from fetch or IO registers a failure and logs an
-            error; pending flags are cleared regardless.
+            Any exception from fetch or IO registers a failure (unless the
+            daemon is stopping), logs an error, and removes any partial file
+            from tmp/; pending flags are cleared regardless.
 
         Thread Safety:
-            Runs on the worker thread; uses per-show lock to update flags and
-            cached state.
+            Runs on a media pool thread; the space check, promotion, and cached
+            state update happen under the per-show lock.
         """
         context = self.show_contexts.get(show_id)
         if not context:
             self.logger.debug("Media fetch skipped: missing context for %s/%s", show_id, filename)
             return
+        # README: write atomically via tmp/ then move to episodes/.
+        tmp_path = context.tmp_dir / filename
         try:
-            if (context.episodes_dir / filename).exists():
-                self.logger.debug("Media already cached for %s/%s", show_id, filename)
+            if os.path.exists(os.path.join(context.episodes_dir_str, filename)):
+                if self._dbg(_DEBUG):
+                    self.logger.debug("Media already cached for %s/%s", show_id, filename)
+                return
+            if not self._ensure_free_space(context):
+                self.logger.warning(
+                    "Skipping %s: less than min_free_bytes=%d free under %s",
+                    filename,
+                    self.config.min_free_bytes,
+                    self.config.storage_path,
+                )
                 return
             # README: fetch media/<filename> over Reticulum.
             media_path = f"/file/{context.subscription.show_name}/media/{filename}"
             self.logger.info("Fetching media for %s/%s at %s", show_id, filename, media_path)
-            payload = self.fetcher.fetch_bytes(context.subscription.destination_hash, media_path)
-            self.logger.info("Fetched media for %s/%s (%d bytes)", show_id, filename, len(payload))
-            if self.config.max_bytes_per_show > 0:
-                if not self._ensure_space_for(context, len(payload)):
-                    self.logger.warning("Skipping %s: exceeds max_bytes_per_show", filename)
-                    return
-            # README: write atomically via tmp/ then move to episodes/.
-            tmp_path = context.tmp_dir / filename
-            self.logger.info("Writing media to tmp path %s (%d bytes)", tmp_path, len(payload))
-            write_atomic(tmp_path, payload)
+            try:
+                size = self.fetcher.fetch_to_file(
+                    context.subscription.destination_hash,
+                    media_path,
+                    tmp_path,
+                    bytes_per_sync=self.config.bytes_per_sync,
+                    max_bytes=self.config.max_bytes_per_show,
+                )
+            except PayloadTooLargeError:
+                # The episode alone exceeds max_bytes_per_show; stop streaming.
+                self.logger.warning("Skipping %s: exceeds max_bytes_per_show", filename)
+                tmp_path.unlink(missing_ok=True)
+                return
+            self.logger.info("Fetched media for %s/%s to %s (%d bytes)", show_id, filename, tmp_path, size)
+            self._adjust_free_space(-size)
             final_path = context.episodes_dir / filename
-            self.logger.info("Promoting media to final path %s", final_path)
-            tmp_path.replace(final_path)
             with context.lock:
+                if self.config.max_bytes_per_show > 0:
+                    if not self._ensure_space_for(context, size):
+                        self.logger.warning("Skipping %s: exceeds max_bytes_per_show", filename)
+                        tmp_path.unlink(missing_ok=True)
+                        return
+                self.logger.info("Promoting media to final path %s", final_path)
+                tmp_path.replace(final_path)
                 order_index = context.order_map.get(filename, len(context.order_map))
-                context.state.cached_episodes.append(
-                    CachedEpisode(filename=filename, order_index=order_index, size_bytes=len(payload))
+                previous = context.state.cached_episodes.get(filename)
+                if previous is not None:
+                    context.cached_total_bytes -= previous.size_bytes
+                context.state.cached_episodes[filename] = CachedEpisode(
+                    filename=filename,
+                    order_index=order_index,
+                    size_bytes=size,
                 )
-                save_show_state(context.state_path, context.state)
+                context.cached_total_bytes += size
+                context.state_dirty = True
+                if context.scan_changes is not None:
+                    context.scan_changes.add(filename)
             self.logger.info("Updated cached episodes for %s/%s", show_id, filename)
-            self._rebuild_client_rss(context)
-            sync_nomadnet_mirror(
-                self.config,
-                context.subscription,
-                default_mirroring_enabled=self.default_mirroring_enabled,
-            )
-            write_nomadnet_index(
-                self.config,
-                self.subscriptions,
-                default_mirroring_enabled=self.default_mirroring_enabled,
-            )
+            self._schedule_publish(context)
             self.logger.info("Cached media %s for %s", filename, show_id)
         except Exception as exc:
-            self._register_failure(context, str(exc))
-            self.logger.error("Failed to fetch media %s for %s: %s", filename, show_id, exc)
+            # Streaming may have started; do not leave a partial file in tmp/.
+            tmp_path.unlink(missing_ok=True)
+            if self.stop_event.is_set():
+                # stop() closed the fetcher under this download; not a show failure.
+                self.logger.debug("Media fetch %s for %s interrupted by shutdown: %s", filename, show_id, exc)
+            else:
+                self._register_failure(context, str(exc))
+                self.logger.error("Failed to fetch media %s for %s: %s", filename, show_id, exc)
         finally:
             with context.lock:
                 context.media_pending.discard(filename)
+                publish_pending = context.publish_timer is not None
+            # A pending debounced publish writes state.json once for every
+            # completion in its window.
+            if not publish_pending:
+                self._flush_if_dirty(context)
 
     def _ensure_space_for(self, context: ShowContext, new_size: int) -> bool:
         """Ensure there is space for a new media file under max_bytes_per_show.
@@ -678,44 +1085,237 @@ class NomadCastDaemon:
             payload would still exceed max_bytes_per_show.
 
         Side Effects:
-            Evicts cached files starting from the oldest order_index and
-            updates state.json to reflect removals.
+            Evicts cached files starting from the oldest order_index and marks
+            the show state dirty so removals are persisted on the next flush.
 
         Thread Safety:
-            Runs on the worker thread; mutates per-show state.
+            Mutates per-show state; callers must hold context.lock.
         """
         # README: enforce max_bytes_per_show with oldest-episode eviction.
         if self.config.max_bytes_per_show <= 0:
             self.logger.debug("Max bytes per show disabled; skipping eviction")
             return True
-        cached = context.state.cached_episodes
-        total = sum(item.size_bytes for item in cached)
+        total = context.cached_total_bytes
         if total + new_size <= self.config.max_bytes_per_show:
+            if self._dbg(_DEBUG):
+                self.logger.debug(
+                    "Sufficient space for new payload (%d bytes) under max_bytes_per_show=%d",
+                    new_size,
+                    self.config.max_bytes_per_show,
+                )
+            return True
+        if new_size > self.config.max_bytes_per_show:
+            # No amount of eviction can make room; keep the existing cache.
+            return False
+        self._adjust_free_space(self._evict_oldest(context, self.config.max_bytes_per_show - new_size))
+        total = context.cached_total_bytes
+        if self._dbg(_DEBUG):
             self.logger.debug(
-                "Sufficient space for new payload (%d bytes) under max_bytes_per_show=%d",
+                "Eviction complete: total=%d new_size=%d max=%d",
+                total,
                 new_size,
                 self.config.max_bytes_per_show,
             )
-            return True
-        evictable = sorted(cached, key=lambda item: item.order_index, reverse=True)
-        while evictable and total + new_size > self.config.max_bytes_per_show:
-            oldest = evictable.pop(0)
-            path = context.episodes_dir / oldest.filename
-            if path.exists():
-                total -= oldest.size_bytes
-                self.logger.debug("Evicting %s to free %d bytes", oldest.filename, oldest.size_bytes)
-                path.unlink()
-            cached = [item for item in cached if item.filename != oldest.filename]
-        context.state.cached_episodes = cached
-        save_show_state(context.state_path, context.state)
-        self.logger.debug(
-            "Eviction complete: total=%d new_size=%d max=%d",
-            total,
-            new_size,
-            self.config.max_bytes_per_show,
-        )
         return total + new_size <= self.config.max_bytes_per_show
 
+    def _evict_oldest(self, context: ShowContext, target_total: int) -> int:
+        """Evict cached episodes, oldest first, until the show fits target_total.
+
+        Outputs:
+            Number of bytes removed from the show's cache.
+
+        Side Effects:
+            Deletes episode files, updates cached_total_bytes, and marks the
+            show state dirty when anything was evicted.
+
+        Thread Safety:
+            Mutates per-show state; callers must hold context.lock.
+        """
+        cached = context.state.cached_episodes
+        total = context.cached_total_bytes
+        # Max-heap on order_index so the oldest episode is popped first.
+        evictable = [(-item.order_index, item.filename) for item in cached.values()]
+        heapq.heapify(evictable)
+        freed = 0
+        while evictable and total > target_total:
+            _, filename = heapq.heappop(evictable)
+            oldest = cached.pop(filename)
+            if context.scan_changes is not None:
+                context.scan_changes.add(filename)
+            total -= oldest.size_bytes
+            freed += oldest.size_bytes
+            if self._dbg(_DEBUG):
+                self.logger.debug("Evicting %s to free %d bytes", filename, oldest.size_bytes)
+            try:
+                os.unlink(os.path.join(context.episodes_dir_str, filename))
+            except FileNotFoundError:
+                pass
+        context.cached_total_bytes = total
+        if freed:
+            context.state_dirty = True
+        return freed
+
+    def _storage_free_bytes(self) -> int | None:
+        """Return free bytes on the storage filesystem, cached briefly.
+
+        Outputs:
+            Bytes available to unprivileged writers under storage_path, or
+            None if the filesystem cannot be queried.
+
+        Thread Safety:
+            Safe to call from any thread; concurrent callers may each refresh
+            the cached reading, which is harmless.
+        """
+        now = time.monotonic()
+        reading = self._free_space
+        if reading is not None and now - reading[0] < _FREE_SPACE_TTL_SECONDS:
+            return reading[1]
+        try:
+            free = shutil.disk_usage(self.config.storage_path).free
+        except OSError as exc:
+            self.logger.debug("Unable to read free space for %s: %s", self.config.storage_path, exc)
+            return None
+        self._free_space = (now, free)
+        return free
+
+    def _adjust_free_space(self, delta: int) -> None:
+        """Apply a known change in used bytes to the cached free-space reading."""
+        reading = self._free_space
+        if reading is not None and delta:
+            self._free_space = (reading[0], reading[1] + delta)
+
+    def _ensure_free_space(self, context: ShowContext) -> bool:
+        """Keep min_free_bytes free on the storage filesystem before a fetch.
+
+        Outputs:
+            True if at least min_free_bytes are free, possibly after evicting
+            the show's oldest episodes; False if the fetch should be skipped.
+            Nothing is evicted when the show's whole cache would not cover
+            the shortfall.
+
+        Side Effects:
+            May evict cached episodes and schedule a client RSS rebuild so
+            the feed stops advertising them.
+
+        Error Conditions:
+            If free space cannot be read the check is skipped and True is
+            returned.
+        """
+        reserve = self.config.min_free_bytes
+        if reserve <= 0:
+            return True
+        free = self._storage_free_bytes()
+        if free is None or free >= reserve:
+            return True
+        with context.lock:
+            if free + context.cached_total_bytes < reserve:
+                # Evicting the whole show would not be enough; keep its cache.
+                return False
+            freed = self._evict_oldest(context, context.cached_total_bytes - (reserve - free))
+        if freed:
+            self._adjust_free_space(freed)
+            self.logger.info(
+                "Evicted %d bytes from %s to keep min_free_bytes free",
+                freed,
+                context.subscription.show_id,
+            )
+            self._schedule_publish(context)
+        return free + freed >= reserve
+
+    def _flush_if_dirty(self, context: ShowContext) -> None:
+        """Persist state.json once if the show state has unsaved changes.
+
+        Side Effects:
+            Writes state.json via save_show_state and clears state_dirty.
+
+        Thread Safety:
+            Uses the per-show lock so concurrent flushes write at most once.
+        """
+        with context.lock:
+            if not context.state_dirty:
+                return
+            save_show_state(context.state_path, context.state)
+            context.state_dirty = False
+
+    def _schedule_publish(self, context: ShowContext) -> None:
+        """Coalesce client RSS rebuilds after media completions.
+
+        Side Effects:
+            Starts a timer that publishes the show and flushes its state once
+            rss_rebuild_debounce_ms has elapsed; completions inside that window
+            share the rebuild and the state.json fsync. Publishes immediately
+            when the debounce is disabled.
+
+        Thread Safety:
+            Safe to call from any thread; the pending timer is tracked under
+            context.lock.
+        """
+        delay = self.config.rss_rebuild_debounce_ms / 1000
+        if delay <= 0:
+            self._publish_show(context)
+            return
+        with context.lock:
+            if context.publish_timer is not None:
+                return
+            timer = threading.Timer(delay, self._run_scheduled_publish, args=(context,))
+            timer.daemon = True
+            context.publish_timer = timer
+            timer.start()
+
+    def _run_scheduled_publish(self, context: ShowContext) -> None:
+        """Publish a show when its debounce timer fires.
+
+        Error Conditions:
+            Publish failures are registered against the show like other
+            media errors.
+        """
+        with context.lock:
+            if context.publish_timer is None:
+                # Already flushed by stop().
+                return
+            context.publish_timer = None
+        try:
+            self._publish_show(context)
+        except Exception as exc:
+            self._register_failure(context, str(exc))
+            self.logger.error("Failed to publish %s: %s", context.subscription.show_id, exc)
+        finally:
+            self._flush_if_dirty(context)
+
+    def _flush_pending_publish(self, context: ShowContext) -> None:
+        """Cancel a pending debounce timer and publish the show now."""
+        with context.lock:
+            timer = context.publish_timer
+            context.publish_timer = None
+        if timer is None:
+            return
+        timer.cancel()
+        try:
+            self._publish_show(context)
+        except Exception as exc:
+            self.logger.error("Failed to publish %s: %s", context.subscription.show_id, exc)
+
+    def _publish_show(self, context: ShowContext) -> None:
+        """Rebuild client RSS and update NomadNet mirror output for a show.
+
+        Thread Safety:
+            Serializes RSS rebuilds per show with context.rss_lock and mirror
+            and index writes across shows with the daemon mirror lock.
+        """
+        with context.rss_lock:
+            self._rebuild_client_rss(context)
+        with self._mirror_lock:
+            sync_nomadnet_mirror(
+                self.config,
+                context.subscription,
+                default_mirroring_enabled=self.default_mirroring_enabled,
+            )
+            write_nomadnet_index(
+                self.config,
+                self.subscriptions,
+                default_mirroring_enabled=self.default_mirroring_enabled,
+            )
+
     def _rebuild_client_rss(self, context: ShowContext) -> None:
         """Rewrite publisher RSS into the client-facing feed.
 
@@ -725,24 +1325,43 @@ class NomadCastDaemon:
         Side Effects:
             Filters enclosures to cached episodes and rewrites enclosure URLs
             to the local HTTP server (respecting public_host, listen_host, and
-            listen_port as described in README).
+            listen_port as described in README). Skips the rewrite when the
+            publisher feed hash, cached filenames, and rewrite settings match
+            the previous rebuild.
 
         Thread Safety:
-            Runs on the worker thread; reads from disk without locking.
+            Callers hold context.rss_lock; cached state is snapshotted under
+            the per-show lock.
         """
         # README: rewrite enclosure URLs to localhost and filter cached items.
-        rss_path = context.show_dir / "publisher_rss.xml"
-        if not rss_path.exists():
-            self.logger.debug("Publisher RSS missing for %s; skipping rewrite", context.subscription.show_id)
+        listen_host = self.config.resolved_public_host
+        show_path = context.encoded_show_path
+        with context.lock:
+            cached_filenames = frozenset(context.state.cached_episodes)
+            rss_hash = context.state.last_rss_hash
+            rss_bytes = context.publisher_rss_bytes
+            # The rewrite mutates the parsed tree, so take it at most once.
+            parsed = context.publisher_rss_parsed
+            context.publisher_rss_parsed = None
+        fingerprint = (
+            rss_hash,
+            cached_filenames,
+            listen_host,
+            self.config.listen_port,
+            self.config.episodes_per_show,
+            self.config.strict_cached_enclosures,
+        )
+        if fingerprint == context.last_client_rss_fp:
+            self.logger.debug("Client RSS unchanged for %s; skipping rewrite", context.subscription.show_id)
             return
-        rss_bytes = rss_path.read_bytes()
-        listen_host = self.config.public_host
-        if not listen_host:
-            # README: when binding to 0.0.0.0, rewrite to 127.0.0.1 unless
-            # public_host is explicitly set.
-            listen_host = self.config.listen_host if self.config.listen_host != "0.0.0.0" else "127.0.0.1"
-        show_path = encode_show_path(context.subscription.destination_hash, context.subscription.show_name)
-        cached_filenames = cached_episode_filenames(context.state.cached_episodes)
+        if rss_bytes is None:
+            try:
+                with open(os.path.join(context.show_dir_str, "publisher_rss.xml"), "rb") as handle:
+                    rss_bytes = handle.read()
+            except FileNotFoundError:
+                self.logger.debug("Publisher RSS missing for %s; skipping rewrite", context.subscription.show_id)
+                return
+            context.publisher_rss_bytes = rss_bytes
         self.logger.debug(
             "Rewriting RSS for %s with host=%s port=%s cached=%d show_path=%s",
             context.subscription.show_id,
@@ -759,5 +1378,7 @@ class NomadCastDaemon:
             cached_filenames=cached_filenames,
             episodes_per_show=self.config.episodes_per_show,
             strict_cached=self.config.strict_cached_enclosures,
+            parsed=parsed,
         )
-        write_atomic(context.show_dir / "client_rss.xml", client_bytes)
+        write_atomic(context.show_dir / "client_rss.xml", client_bytes, durable=False)
+        context.last_client_rss_fp = fingerprint
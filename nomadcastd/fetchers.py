@@ -10,14 +10,68 @@ import importlib
 import importlib.util
 import io
 import logging
-import time
+import os
 import threading
+import time
 from dataclasses import dataclass
+from pathlib import Path
 from types import ModuleType
-from typing import Protocol
+from typing import Callable, Iterable, Protocol, TypeVar
+
+from .reticulum_downloader import NomadnetDownloader, close_cached_links
+from .reticulum_types import RequestReceiptType, ReticulumProtocol, RNSModule
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 65536
+
+_T = TypeVar("_T")
+
+_fdatasync = getattr(os, "fdatasync", os.fsync)
+
+
+class PayloadTooLargeError(RuntimeError):
+    """Raised when a streamed payload exceeds the caller's max_bytes limit."""
 
-from .reticulum_downloader import NomadnetDownloader
-from .reticulum_types import DestinationType, LinkType, RequestReceiptType, ReticulumProtocol, RNSModule
+
+def _write_chunks(
+    dest: Path,
+    chunks: Iterable[bytes | memoryview],
+    *,
+    bytes_per_sync: int = 0,
+    max_bytes: int = 0,
+) -> int:
+    """Write chunks to dest and return the number of bytes written.
+
+    Data is synced every bytes_per_sync bytes (when positive) so large
+    downloads do not end in one long sync. A final fdatasync covers only the
+    tail written since the last sync; the file's data and size must be on
+    disk before callers rename it into place, but its timestamps need not be.
+
+    Error Conditions:
+        Raises PayloadTooLargeError as soon as the payload would exceed
+        max_bytes (when positive); dest then holds a partial file.
+    """
+    written = 0
+    unsynced = 0
+    fd = os.open(dest, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        for chunk in chunks:
+            written += len(chunk)
+            if max_bytes > 0 and written > max_bytes:
+                raise PayloadTooLargeError(f"Payload for {dest.name} exceeds {max_bytes} bytes")
+            view = memoryview(chunk)
+            while view:
+                view = view[os.write(fd, view) :]
+            unsynced += len(chunk)
+            if bytes_per_sync > 0 and unsynced >= bytes_per_sync:
+                _fdatasync(fd)
+                unsynced = 0
+        if unsynced:
+            _fdatasync(fd)
+    finally:
+        os.close(fd)
+    return written
 
 
 class Fetcher(Protocol):
@@ -41,7 +95,57 @@ class Fetcher(Protocol):
         """
         ...
 
+    def fetch_to_file(
+        self,
+        destination_hash: str,
+        resource_path: str,
+        dest: Path,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        *,
+        bytes_per_sync: int = 0,
+        max_bytes: int = 0,
+    ) -> int:
+        """Fetch a remote resource and stream it into a local file.
 
+        Inputs:
+            destination_hash: Reticulum destination hash in hex string form.
+            resource_path: Path requested by the publisher.
+            dest: File path to write; it is created or truncated.
+            chunk_size: Maximum bytes copied per write when the transport
+                exposes a readable stream.
+            bytes_per_sync: Sync written data every this many bytes; 0 only
+                syncs once at the end.
+            max_bytes: Abort once the payload exceeds this size; 0 disables
+                the limit.
+
+        Outputs:
+            Number of bytes written to dest.
+
+        Error Conditions:
+            Same as fetch_bytes, plus OSError for local write failures and
+            PayloadTooLargeError when max_bytes is exceeded.
+        """
+        ...
+
+    def prewarm(self, destination_hashes: Iterable[str]) -> None:
+        """Start any slow per-destination setup ahead of the first fetch.
+
+        Inputs:
+            destination_hashes: Hex-encoded destination hashes that are about
+                to be fetched.
+
+        Side Effects:
+            Implementations may start network lookups in the background; this
+            must not block on them. The default does nothing.
+        """
+
+    def close(self) -> None:
+        """Release transport resources kept between fetches.
+
+        Side Effects:
+            Implementations that keep connections open across calls close
+            them here. The default does nothing.
+        """
 
 
 @dataclass
@@ -55,7 +159,6 @@ class MockFetcher(Fetcher):
         This test helper ignores destination_hash and matches feed paths based
         on README conventions.
         """
-        logger = logging.getLogger("nomadcastd.fetchers")
         logger.debug(
             "MockFetcher requested destination=%s resource=%s",
             destination_hash,
@@ -79,6 +182,25 @@ class MockFetcher(Fetcher):
             )
         return payload
 
+    def fetch_to_file(
+        self,
+        destination_hash: str,
+        resource_path: str,
+        dest: Path,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        *,
+        bytes_per_sync: int = 0,
+        max_bytes: int = 0,
+    ) -> int:
+        """Write the canned payload for resource_path to dest in chunks."""
+        payload = memoryview(self.fetch_bytes(destination_hash, resource_path))
+        return _write_chunks(
+            dest,
+            (payload[offset : offset + chunk_size] for offset in range(0, len(payload), chunk_size)),
+            bytes_per_sync=bytes_per_sync,
+            max_bytes=max_bytes,
+        )
+
 
 class ReticulumFetcher(Fetcher):
     """Fetcher implementation backed by Reticulum (RNS).
@@ -107,11 +229,16 @@ class ReticulumFetcher(Fetcher):
             required symbols.
 
         Thread Safety:
-            Reticulum initialization is protected by a class-level lock; it is
-            safe to construct multiple instances.
+            Reticulum module loading and initialization are protected by a
+            class-level lock; it is safe to construct multiple instances. The
+            module is resolved once per process and reused by later instances.
         """
-        self.logger = logging.getLogger("nomadcastd.fetchers")
-        self._rns: RNSModule = self._load_rns()
+        self.logger = logger
+        cls = type(self)
+        with cls._reticulum_lock:
+            if cls._rns_module is None:
+                cls._rns_module = self._load_rns()
+        self._rns: RNSModule = cls._rns_module
         self._ensure_reticulum(config_dir)
         self.config_dir = config_dir
         self.destination_app = destination_app
@@ -134,7 +261,107 @@ class ReticulumFetcher(Fetcher):
             timeouts.
 
         Thread Safety:
-            Link objects are per-call; this method is safe for concurrent use.
+            Safe for concurrent use. Concurrent calls to one destination share
+            a cached link; callers bound concurrency themselves (the daemon
+            uses max_concurrent_fetches).
+        """
+        payload = self._fetch(destination_hash, resource_path, self._extract_file_payload)
+        self.logger.info(
+            "Reticulum fetch complete destination=%s resource=%s bytes=%d",
+            destination_hash,
+            resource_path,
+            len(payload),
+        )
+        return payload
+
+    def fetch_to_file(
+        self,
+        destination_hash: str,
+        resource_path: str,
+        dest: Path,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        *,
+        bytes_per_sync: int = 0,
+        max_bytes: int = 0,
+    ) -> int:
+        """Fetch a resource via Reticulum and stream it into dest.
+
+        Buffered-reader responses are copied chunk by chunk so the payload is
+        never held in memory as a single bytes object.
+
+        Outputs:
+            Number of bytes written to dest.
+
+        Error Conditions:
+            Same as fetch_bytes, plus OSError for local write failures and
+            PayloadTooLargeError when max_bytes is exceeded.
+        """
+        written = self._fetch(
+            destination_hash,
+            resource_path,
+            lambda receipt: self._write_file_payload(
+                receipt,
+                dest,
+                chunk_size,
+                bytes_per_sync=bytes_per_sync,
+                max_bytes=max_bytes,
+            ),
+        )
+        self.logger.info(
+            "Reticulum fetch complete destination=%s resource=%s bytes=%d dest=%s",
+            destination_hash,
+            resource_path,
+            written,
+            dest,
+        )
+        return written
+
+    def prewarm(self, destination_hashes: Iterable[str]) -> None:
+        """Request Reticulum paths for destinations that do not have one yet.
+
+        Path requests are sent without waiting for answers, so paths for
+        shows whose refresh is still queued behind max_concurrent_refreshes
+        resolve while earlier refreshes run. Invalid hashes are logged and
+        skipped.
+        """
+        transport = self._rns.Transport
+        for destination_hash in destination_hashes:
+            try:
+                destination_bytes = bytes.fromhex(destination_hash)
+            except ValueError:
+                self.logger.warning("Skipping path prewarm for invalid destination hash: %s", destination_hash)
+                continue
+            if not transport.has_path(destination_bytes):
+                self.logger.debug("Requesting path ahead of fetch destination=%s", destination_hash)
+                transport.request_path(destination_bytes)
+
+    def close(self) -> None:
+        """Tear down the Reticulum links cached for reuse between fetches.
+
+        Side Effects:
+            Later fetches re-establish links as needed; the Reticulum
+            instance itself stays up for the life of the process.
+        """
+        close_cached_links()
+
+    def _fetch(
+        self,
+        destination_hash: str,
+        resource_path: str,
+        handle_receipt: Callable[[RequestReceiptType], _T],
+    ) -> _T:
+        """Request a resource and hand the completed receipt to handle_receipt.
+
+        handle_receipt runs on the calling thread once the response has
+        arrived, so slow disk writes neither block the Reticulum callback
+        thread nor race a caller that has already timed out. Its return value
+        is passed back to the caller.
+
+        Error Conditions:
+            Raises TimeoutError once _request_timeout_seconds pass with no
+            response and no download progress. Progress extends the deadline,
+            since RNS keeps large responses alive past the request timeout. A
+            receipt that arrives after the caller gave up is ignored.
         """
         normalized_path = self._normalize_resource_path(resource_path)
         self.logger.info(
@@ -146,33 +373,29 @@ class ReticulumFetcher(Fetcher):
             self.destination_app,
             self.destination_aspects,
         )
-        self.logger.info(
-            "Reticulum fetch context thread=%s rns_module=%s rns_file=%s",
-            threading.current_thread().name,
-            getattr(self._rns, "__name__", type(self._rns).__name__),
-            getattr(self._rns, "__file__", "unknown"),
-        )
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "Reticulum fetch context thread=%s rns_module=%s rns_file=%s",
+                threading.current_thread().name,
+                getattr(self._rns, "__name__", type(self._rns).__name__),
+                getattr(self._rns, "__file__", "unknown"),
+            )
         try:
             destination_bytes = bytes.fromhex(destination_hash)
         except ValueError as exc:
             self.logger.error("Destination hash is not valid hex: %s", destination_hash)
             raise ValueError(f"Destination hash is not valid hex: {destination_hash}") from exc
         result_event = threading.Event()
-        result_payload: bytes | None = None
+        result_receipt: RequestReceiptType | None = None
         result_error: Exception | None = None
+        abandoned = False
+        last_activity = 0.0
 
         def on_download_success(receipt: RequestReceiptType) -> None:
-            nonlocal result_payload, result_error
-            if receipt.response is None:
-                result_error = RuntimeError(f"Reticulum response missing for {normalized_path}")
-            else:
-                try:
-                    result_payload = self._extract_file_payload(receipt)
-                except Exception as exc:
-                    result_error = RuntimeError(
-                        f"Reticulum response unsupported for {normalized_path}: {exc}"
-                    )
-                    result_error.__cause__ = exc
+            nonlocal result_receipt
+            if abandoned:
+                return
+            result_receipt = receipt
             result_event.set()
 
         def on_download_failure(message: str) -> None:
@@ -180,8 +403,21 @@ class ReticulumFetcher(Fetcher):
             result_error = RuntimeError(f"Reticulum download failed for {normalized_path}: {message}")
             result_event.set()
 
+        progress_step = -1
+
         def on_progress_update(progress: float) -> None:
-            self.logger.info("Reticulum download progress resource=%s progress=%.2f", normalized_path, progress)
+            # RNS reports progress per received part; log each 10% step once.
+            nonlocal progress_step, last_activity
+            last_activity = time.monotonic()
+            step = int(progress * 10)
+            if step != progress_step:
+                progress_step = step
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug(
+                        "Reticulum download progress resource=%s progress=%.2f",
+                        normalized_path,
+                        progress,
+                    )
 
         downloader = NomadnetDownloader(
             self._rns,
@@ -192,25 +428,33 @@ class ReticulumFetcher(Fetcher):
             on_download_failure,
             on_progress_update,
             timeout=int(self._request_timeout_seconds),
+            app_name=self.destination_app,
+            aspects=self.destination_aspects,
         )
         downloader.download()
-        if not result_event.wait(self._request_timeout_seconds + 30):
-            raise TimeoutError(f"Timed out waiting for Reticulum response for {normalized_path}")
+        # download() returns once the request is sent (or has failed).
+        last_activity = time.monotonic()
+        timeout = self._request_timeout_seconds
+        while not result_event.wait(timeout):
+            idle = time.monotonic() - last_activity
+            if idle >= self._request_timeout_seconds:
+                abandoned = True
+                raise TimeoutError(f"Timed out waiting for Reticulum response for {normalized_path}")
+            timeout = self._request_timeout_seconds - idle
         if result_error is not None:
             raise result_error
-        if result_payload is None:
+        if result_receipt is None or result_receipt.response is None:
             raise RuntimeError(f"Reticulum response missing for {normalized_path}")
-        self.logger.info(
-            "Reticulum fetch complete destination=%s resource=%s bytes=%d",
-            destination_hash,
-            normalized_path,
-            len(result_payload),
-        )
-        return result_payload
+        try:
+            return handle_receipt(result_receipt)
+        except (PayloadTooLargeError, OSError):
+            raise
+        except Exception as exc:
+            raise RuntimeError(f"Reticulum response unsupported for {normalized_path}: {exc}") from exc
 
     _reticulum_lock = threading.Lock()
+    _rns_module: RNSModule | None = None
     _reticulum_instance: ReticulumProtocol | None = None
-    _link_timeout_seconds = 30.0
     _request_timeout_seconds = 120.0
     _required_rns_symbols = ("Reticulum", "Destination", "Link", "Identity", "RequestReceipt", "Transport")
 
@@ -322,154 +566,6 @@ class ReticulumFetcher(Fetcher):
             else:
                 self.logger.info("Reusing Reticulum singleton instance=%r", cls._reticulum_instance)
 
-    def _resolve_destination(self, destination_hash: str) -> DestinationType:
-        """Resolve a destination hash into a Reticulum Destination.
-
-        Error Conditions:
-            Raises ValueError for invalid hex and RuntimeError if the
-            destination cannot be resolved.
-        """
-        try:
-            destination_bytes = bytes.fromhex(destination_hash)
-        except ValueError as exc:
-            self.logger.error("Destination hash is not valid hex: %s", destination_hash)
-            raise ValueError(f"Destination hash is not valid hex: {destination_hash}") from exc
-        destination = self._resolve_destination_from_identity(destination_hash, destination_bytes)
-        if destination is not None:
-            return destination
-        destination = self._recall_destination(destination_hash, destination_bytes)
-        if destination is not None:
-            return destination
-        self.logger.error("Reticulum destination not found for %s", destination_hash)
-        raise RuntimeError(f"Reticulum destination not found for {destination_hash}")
-
-    def _resolve_destination_from_identity(
-        self,
-        destination_hash: str,
-        destination_bytes: bytes,
-    ) -> DestinationType | None:
-        """Attempt to build a Destination from a recalled Identity.
-
-        MeshChat's NomadNet downloader treats the URL prefix as an identity
-        hash and then derives the app/aspects destination from that identity.
-        We mirror that behavior by constructing a destination from the recalled
-        identity.
-        """
-        identity_recall = getattr(self._rns.Identity, "recall", None)
-        if not callable(identity_recall):
-            return None
-        identity = identity_recall(destination_bytes)
-        if identity is None:
-            try:
-                identity = identity_recall(destination_bytes, from_identity_hash=True)
-            except TypeError:
-                identity = None
-        if identity is None:
-            return None
-        destination = self._rns.Destination(
-            identity,
-            self._rns.Destination.OUT,
-            self._rns.Destination.SINGLE,
-            self.destination_app,
-            *self.destination_aspects,
-        )
-        self.logger.info(
-            "Reticulum destination constructed from identity hash %s app=%s aspects=%s",
-            destination_hash,
-            self.destination_app,
-            self.destination_aspects,
-        )
-        return destination
-
-    def _await_link(self, link: LinkType, resource_path: str) -> None:
-        """Wait for a Reticulum link to become ACTIVE.
-
-        Error Conditions:
-            Raises RuntimeError if the link closes and TimeoutError if the
-            link is not active before _link_timeout_seconds.
-        """
-        deadline = time.monotonic() + self._link_timeout_seconds
-        self.logger.info(
-            "Awaiting Reticulum link resource=%s timeout=%s deadline=%s initial_status=%s",
-            resource_path,
-            self._link_timeout_seconds,
-            deadline,
-            link.status,
-        )
-        last_status = None
-        attempts = 0
-        while time.monotonic() < deadline:
-            attempts += 1
-            now = time.monotonic()
-            self.logger.info(
-                "Reticulum link poll resource=%s attempt=%d elapsed=%.3f status=%s",
-                resource_path,
-                attempts,
-                now - (deadline - self._link_timeout_seconds),
-                link.status,
-            )
-            if link.status == self._rns.Link.ACTIVE:
-                self.logger.info("Reticulum link active for %s", resource_path)
-                return
-            if link.status == self._rns.Link.CLOSED:
-                self.logger.error("Reticulum link closed while requesting %s", resource_path)
-                raise RuntimeError(f"Reticulum link closed while requesting {resource_path}")
-            if link.status != last_status:
-                self.logger.info(
-                    "Reticulum link status update for %s: %s",
-                    resource_path,
-                    link.status,
-                )
-                last_status = link.status
-            time.sleep(0.1)
-        self.logger.error("Reticulum link timed out for %s", resource_path)
-        raise TimeoutError(f"Timed out establishing Reticulum link for {resource_path}")
-
-    def _await_request(self, receipt: RequestReceiptType, resource_path: str) -> bytes:
-        """Wait for a Reticulum request receipt to complete.
-
-        Error Conditions:
-            Raises RuntimeError on FAILED or missing response and TimeoutError
-            if the response is not ready before _request_timeout_seconds.
-        """
-        deadline = time.monotonic() + self._request_timeout_seconds
-        self.logger.info(
-            "Awaiting Reticulum response resource=%s timeout=%s deadline=%s receipt=%r",
-            resource_path,
-            self._request_timeout_seconds,
-            deadline,
-            receipt,
-        )
-        attempts = 0
-        while time.monotonic() < deadline:
-            attempts += 1
-            status = receipt.get_status()
-            now = time.monotonic()
-            self.logger.info(
-                "Reticulum receipt poll resource=%s attempt=%d elapsed=%.3f status=%s response_len=%s",
-                resource_path,
-                attempts,
-                now - (deadline - self._request_timeout_seconds),
-                status,
-                None if receipt.response is None else len(receipt.response),
-            )
-            if status == self._rns.RequestReceipt.READY:
-                if receipt.response is None:
-                    self.logger.error("Reticulum response missing for %s", resource_path)
-                    raise RuntimeError(f"Reticulum response missing for {resource_path}")
-                self.logger.info(
-                    "Reticulum receipt ready resource=%s bytes=%d",
-                    resource_path,
-                    len(receipt.response),
-                )
-                return bytes(receipt.response)
-            if status == self._rns.RequestReceipt.FAILED:
-                self.logger.error("Reticulum request failed for %s", resource_path)
-                raise RuntimeError(f"Reticulum request failed for {resource_path}")
-            time.sleep(0.1)
-        self.logger.error("Reticulum response timeout for %s", resource_path)
-        raise TimeoutError(f"Timed out waiting for Reticulum response for {resource_path}")
-
     def _extract_file_payload(self, request_receipt: RequestReceiptType) -> bytes:
         # get response
         response = request_receipt.response
@@ -508,19 +604,31 @@ class ReticulumFetcher(Fetcher):
         file_data: bytes = response[1]
         return file_data
 
+    def _write_file_payload(
+        self,
+        request_receipt: RequestReceiptType,
+        dest: Path,
+        chunk_size: int,
+        *,
+        bytes_per_sync: int = 0,
+        max_bytes: int = 0,
+    ) -> int:
+        """Stream a receipt payload into dest and return the bytes written."""
+        response = request_receipt.response
+        if isinstance(response, io.BufferedReader):
+            chunks: Iterable[bytes] = iter(lambda: response.read(chunk_size), b"")
+        else:
+            chunks = (self._extract_file_payload(request_receipt),)
+        return _write_chunks(dest, chunks, bytes_per_sync=bytes_per_sync, max_bytes=max_bytes)
+
     def _normalize_resource_path(self, resource_path: str) -> str:
         """Normalize a resource path for Reticulum requests.
 
         MeshChat and NomadNet file links are typically addressed with a leading
         slash (e.g. /file/<show>/feed.rss). Normalize to that format to align
-        with external clients.
+        with external clients. The caller's fetch-start log already records
+        both forms, so this does no logging of its own.
         """
-        if not resource_path:
-            self.logger.info("Normalize resource path: empty input")
-            return resource_path
-        if resource_path.startswith("/"):
-            self.logger.info("Normalize resource path: already normalized %s", resource_path)
+        if not resource_path or resource_path[0] == "/":
             return resource_path
-        normalized = f"/{resource_path}"
-        self.logger.info("Normalized resource path %s -> %s", resource_path, normalized)
-        return normalized
+        return f"/{resource_path}"
@@ -11,7 +11,7 @@ from xml.etree import ElementTree
 
 from nomadcastd.config import NomadCastConfig, set_mirroring_enabled
 from nomadcastd.parsing import Subscription, encode_show_path, parse_nomadcast_media_url, parse_subscription_uri
-from nomadcastd.rss import parse_rss_items
+from nomadcastd.rss import parse_rss_items, sorted_items
 from nomadcastd.storage import write_atomic, show_directory
 
 MIRROR_WARNING = (
@@ -197,16 +197,6 @@ def _mirror_media_href(subscription: Subscription, filename: str) -> str:
     return f"/file/nomadcast/{show_path}/media/{encoded_filename}"
 
 
-def _sorted_rss_items(items: list) -> list:
-    if any(item.pub_date is not None for item in items):
-        return sorted(
-            items,
-            key=lambda item: item.pub_date if item.pub_date is not None else 0,
-            reverse=True,
-        )
-    return items
-
-
 def _episode_previews(
     rss_path: Path,
     episodes_dir: Path,
@@ -222,11 +212,11 @@ def _episode_previews(
     except OSError:
         return []
     try:
-        _, items = parse_rss_items(rss_bytes)
+        _, items, has_pub_dates = parse_rss_items(rss_bytes)
     except ElementTree.ParseError:
         return []
     previews: list[tuple[str, str]] = []
-    for item in _sorted_rss_items(items):
+    for item in sorted_items(items, has_pub_dates):
         if len(previews) >= max_count:
             break
         title = item.element.findtext("title")
@@ -318,7 +308,7 @@ def write_nomadnet_index(
     pages_dir = nomadnet_paths(config).pages_dir
     index_path = pages_dir / "nomadcast" / "index.mu"
     index_path.parent.mkdir(parents=True, exist_ok=True)
-    write_atomic(index_path, content.encode("utf-8"))
+    write_atomic(index_path, content.encode("utf-8"), durable=False)
     return index_path
 
 
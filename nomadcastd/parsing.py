@@ -153,6 +153,16 @@ def parse_nomadcast_media_url(url: str) -> tuple[str, str, str]:
     return destination_hash, show_name, filename
 
 
+def media_url_prefixes(destination_hash: str, show_name: str) -> tuple[str, str]:
+    """Return the media URL prefixes accepted by `parse_nomadcast_media_url` for a show.
+
+    A URL starting with either prefix belongs to the show; the remainder is the
+    URL-encoded filename.
+    """
+    body = f"{destination_hash}:{show_name}{MEDIA_PREFIX}"
+    return f"{NOMADCAST_URL_PREFIX}{body}", f"{NOMADCAST_PREFIX}{body}"
+
+
 def sanitize_filename(filename: str) -> bool:
     """Return True if filename matches the safe subset in README requirements."""
     if not filename or len(filename) > 255:
@@ -3,14 +3,89 @@ from __future__ import annotations
 """Reticulum downloader utility for NomadNet resources."""
 
 import logging
+import threading
 import time
-from typing import Callable
+import weakref
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Callable, Iterator
 
 from .reticulum_types import LinkType, RequestReceiptType, RNSModule
 
 logger = logging.getLogger("nomadcastd.fetchers")
 
-nomadnet_cached_links: dict[bytes, LinkType] = {}
+# Links are reused across requests to the same destination. Callbacks arrive
+# on RNS threads, so access goes through the helpers below; the least
+# recently used link is torn down once more than _LINK_CACHE_MAX are held.
+_LINK_CACHE_MAX = 64
+_link_cache_lock = threading.Lock()
+_link_cache: OrderedDict[bytes, LinkType] = OrderedDict()
+# One lock per destination serializes link setup, so concurrent fetches to a
+# node share the first fetch's link instead of each opening their own. Each
+# entry is [lock, users] and is removed once no fetch is using it, so the map
+# only holds destinations with a setup in progress.
+_link_setup_locks: dict[bytes, list] = {}
+
+
+# Destinations whose path lookup timed out recently fail fast instead of each
+# fetch waiting out path_lookup_timeout again.
+_PATH_FAILURE_TTL_SECONDS = 60.0
+_path_failures: dict[bytes, float] = {}
+
+
+def _get_cached_link(destination_hash: bytes) -> LinkType | None:
+    """Return the cached link for destination_hash, marking it recently used."""
+    with _link_cache_lock:
+        link = _link_cache.get(destination_hash)
+        if link is not None:
+            _link_cache.move_to_end(destination_hash)
+        return link
+
+
+def _put_cached_link(destination_hash: bytes, link: LinkType) -> None:
+    """Cache link for destination_hash, tearing down any evicted link."""
+    evicted: list[LinkType] = []
+    with _link_cache_lock:
+        _link_cache[destination_hash] = link
+        _link_cache.move_to_end(destination_hash)
+        while len(_link_cache) > _LINK_CACHE_MAX:
+            evicted.append(_link_cache.popitem(last=False)[1])
+    for stale in evicted:
+        stale.teardown()
+
+
+@contextmanager
+def _link_setup_lock(destination_hash: bytes) -> Iterator[None]:
+    """Hold the lock that serializes link setup for destination_hash."""
+    with _link_cache_lock:
+        entry = _link_setup_locks.get(destination_hash)
+        if entry is None:
+            entry = _link_setup_locks[destination_hash] = [threading.Lock(), 0]
+        entry[1] += 1
+    try:
+        with entry[0]:
+            yield
+    finally:
+        with _link_cache_lock:
+            entry[1] -= 1
+            if entry[1] == 0:
+                del _link_setup_locks[destination_hash]
+
+
+def _drop_cached_link(destination_hash: bytes, link: LinkType) -> None:
+    """Forget link if it is still the cached link for destination_hash."""
+    with _link_cache_lock:
+        if _link_cache.get(destination_hash) is link:
+            del _link_cache[destination_hash]
+
+
+def close_cached_links() -> None:
+    """Tear down and forget every cached link."""
+    with _link_cache_lock:
+        links = list(_link_cache.values())
+        _link_cache.clear()
+    for link in links:
+        link.teardown()
 
 
 class NomadnetDownloader:
@@ -24,9 +99,12 @@ class NomadnetDownloader:
         on_download_failure: Callable[[str], None],
         on_progress_update: Callable[[float], None],
         timeout: int | None = None,
+        *,
+        app_name: str = "nomadnetwork",
+        aspects: tuple[str, ...] = ("node",),
     ) -> None:
-        self.app_name = "nomadnetwork"
-        self.aspects = "node"
+        self.app_name = app_name
+        self.aspects = aspects
         self.rns = rns
         self.destination_hash = destination_hash
         self.path = path
@@ -35,27 +113,53 @@ class NomadnetDownloader:
         self.on_download_success = on_download_success
         self.on_download_failure = on_download_failure
         self.on_progress_update = on_progress_update
+        # Set when the link is established or closes, so the caller blocks
+        # instead of polling and learns of a failed link immediately.
+        self.link_ready = threading.Event()
 
     def download(self, path_lookup_timeout: int = 15, link_establishment_timeout: int = 15) -> None:
         """Open a link (or reuse one) and dispatch the request."""
-        if self.destination_hash in nomadnet_cached_links:
-            link = nomadnet_cached_links[self.destination_hash]
-            if link.status is self.rns.Link.ACTIVE:
-                logger.info("NomadnetDownloader using existing link for request")
-                self.link_established(link)
+        if self._request_on_cached_link():
+            return
+        with _link_setup_lock(self.destination_hash):
+            # Another fetch may have opened the link while this one waited.
+            if self._request_on_cached_link():
                 return
+            self._open_link(path_lookup_timeout, link_establishment_timeout)
+
+    def _request_on_cached_link(self) -> bool:
+        """Send the request over the cached link if it is still active."""
+        link = _get_cached_link(self.destination_hash)
+        if link is None or link.status is not self.rns.Link.ACTIVE:
+            return False
+        logger.debug("NomadnetDownloader using existing link for request")
+        self.link_established(link)
+        return True
 
-        timeout_after_seconds = time.time() + path_lookup_timeout
+    def _open_link(self, path_lookup_timeout: int, link_establishment_timeout: int) -> None:
+        """Find a path, establish a new link, and send the request over it."""
+        timeout_after_seconds = time.monotonic() + path_lookup_timeout
 
         if not self.rns.Transport.has_path(self.destination_hash):
+            failed_at = _path_failures.get(self.destination_hash)
+            if failed_at is not None and time.monotonic() - failed_at < _PATH_FAILURE_TTL_SECONDS:
+                self.on_download_failure("Could not find path to destination (recent lookup failed).")
+                return
+
             self.rns.Transport.request_path(self.destination_hash)
 
-            while not self.rns.Transport.has_path(self.destination_hash) and time.time() < timeout_after_seconds:
-                time.sleep(0.1)
+            # Nearby nodes answer within a few milliseconds, so start polling
+            # fast and back off towards 50 ms for slow multi-hop lookups.
+            backoff = 0.001
+            while not self.rns.Transport.has_path(self.destination_hash) and time.monotonic() < timeout_after_seconds:
+                time.sleep(backoff)
+                backoff = min(backoff * 2, 0.05)
 
         if not self.rns.Transport.has_path(self.destination_hash):
+            _path_failures[self.destination_hash] = time.monotonic()
             self.on_download_failure("Could not find path to destination.")
             return
+        _path_failures.pop(self.destination_hash, None)
 
         identity = self.rns.Identity.recall(self.destination_hash)
         destination = self.rns.Destination(
@@ -63,23 +167,51 @@ class NomadnetDownloader:
             self.rns.Destination.OUT,
             self.rns.Destination.SINGLE,
             self.app_name,
-            self.aspects,
+            *self.aspects,
         )
 
-        logger.info("NomadnetDownloader establishing new link for request")
-        link = self.rns.Link(destination, established_callback=self.link_established)
-
-        timeout_after_seconds = time.time() + link_establishment_timeout
+        logger.debug("NomadnetDownloader establishing new link for request")
+        established_callback, closed_callback = self._link_callbacks()
+        link = self.rns.Link(
+            destination,
+            established_callback=established_callback,
+            closed_callback=closed_callback,
+        )
 
-        while link.status is not self.rns.Link.ACTIVE and time.time() < timeout_after_seconds:
-            time.sleep(0.1)
+        self.link_ready.wait(link_establishment_timeout)
 
         if link.status is not self.rns.Link.ACTIVE:
             self.on_download_failure("Could not establish link to destination.")
 
+    def _link_callbacks(self) -> tuple[Callable[[LinkType], None], Callable[[LinkType], None]]:
+        """Build link callbacks that do not keep this downloader alive.
+
+        RNS holds a link's callbacks for the link's whole lifetime, and the
+        link outlives this request in the link cache. The callbacks therefore
+        reach the downloader through a weak reference; once its fetch has
+        finished or given up, a late establishment only caches the link.
+        """
+        owner = weakref.ref(self)
+        destination_hash = self.destination_hash
+        link_ready = self.link_ready
+
+        def established(link: LinkType) -> None:
+            downloader = owner()
+            if downloader is not None:
+                downloader.link_established(link)
+            else:
+                _put_cached_link(destination_hash, link)
+
+        def closed(link: LinkType) -> None:
+            _drop_cached_link(destination_hash, link)
+            link_ready.set()
+
+        return established, closed
+
     def link_established(self, link: LinkType) -> None:
         """Cache the link and start the request once it is active."""
-        nomadnet_cached_links[self.destination_hash] = link
+        _put_cached_link(self.destination_hash, link)
+        self.link_ready.set()
 
         link.request(
             self.path,
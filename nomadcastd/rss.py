@@ -8,8 +8,9 @@ advertised (README v0 cache policy).
 """
 
 import email.utils
+import heapq
 from dataclasses import dataclass
-from typing import Iterable
+from typing import AbstractSet, Iterable
 from urllib.parse import quote
 from xml.etree import ElementTree
 
@@ -29,6 +30,20 @@ class RssItem:
     pub_date: float | None
 
 
+# Result of parse_rss_items: (tree, items, has_pub_dates).
+ParsedRss = tuple[ElementTree.ElementTree, list[RssItem], bool]
+
+RSS1_CHANNEL_TAG = "{http://purl.org/rss/1.0/}channel"
+SY_NS = "{http://purl.org/rss/1.0/modules/syndication/}"
+SY_PERIOD_SECONDS = {
+    "hourly": 60 * 60,
+    "daily": 24 * 60 * 60,
+    "weekly": 7 * 24 * 60 * 60,
+    "monthly": 30 * 24 * 60 * 60,
+    "yearly": 365 * 24 * 60 * 60,
+}
+
+
 def _parse_pub_date(value: str | None) -> float | None:
     if not value:
         return None
@@ -39,11 +54,16 @@ def _parse_pub_date(value: str | None) -> float | None:
         return None
 
 
-def parse_rss_items(rss_bytes: bytes) -> tuple[ElementTree.ElementTree, list[RssItem]]:
-    """Parse RSS bytes into a tree and item metadata for selection."""
+def parse_rss_items(rss_bytes: bytes) -> ParsedRss:
+    """Parse RSS bytes into a tree and item metadata for selection.
+
+    The third tuple element reports whether any item has a parseable pubDate,
+    so callers can decide how to order items without rescanning them.
+    """
     root = ElementTree.fromstring(rss_bytes)
     tree = ElementTree.ElementTree(root)
     items: list[RssItem] = []
+    has_pub_dates = False
     for item in root.findall(".//item"):
         enclosures = []
         for enclosure in item.findall("enclosure"):
@@ -54,13 +74,48 @@ def parse_rss_items(rss_bytes: bytes) -> tuple[ElementTree.ElementTree, list[Rss
         pub_date_element = item.find("pubDate")
         if pub_date_element is not None:
             pub_date = _parse_pub_date(pub_date_element.text)
+            if pub_date is not None:
+                has_pub_dates = True
         items.append(RssItem(element=item, enclosure_urls=enclosures, pub_date=pub_date))
-    return tree, items
+    return tree, items, has_pub_dates
+
+
+def feed_poll_interval(tree: ElementTree.ElementTree) -> int | None:
+    """Return the refresh interval a feed declares for itself, in seconds.
+
+    Prefers the RSS 2.0 <ttl> (minutes) and falls back to the syndication
+    module's sy:updatePeriod divided by sy:updateFrequency. Returns None when
+    the feed declares neither or the values are unusable.
+    """
+    root = tree.getroot()
+    channel = root.find("channel")
+    if channel is None:
+        channel = root.find(RSS1_CHANNEL_TAG)
+    if channel is None:
+        return None
+    ttl = channel.findtext("ttl")
+    if ttl:
+        try:
+            minutes = int(ttl.strip())
+        except ValueError:
+            minutes = 0
+        if minutes > 0:
+            return minutes * 60
+    period = channel.findtext(f"{SY_NS}updatePeriod")
+    period_seconds = SY_PERIOD_SECONDS.get(period.strip().lower()) if period else None
+    if period_seconds is None:
+        return None
+    frequency_text = channel.findtext(f"{SY_NS}updateFrequency")
+    try:
+        frequency = int(frequency_text.strip()) if frequency_text else 1
+    except ValueError:
+        frequency = 1
+    return period_seconds // max(frequency, 1)
 
 
-def _sorted_items(items: list[RssItem]) -> list[RssItem]:
+def sorted_items(items: list[RssItem], has_pub_dates: bool) -> list[RssItem]:
     """Sort items by pubDate when available (README: prefer recent episodes)."""
-    if any(item.pub_date is not None for item in items):
+    if has_pub_dates:
         return sorted(
             items,
             key=lambda item: item.pub_date if item.pub_date is not None else 0,
@@ -69,19 +124,40 @@ def _sorted_items(items: list[RssItem]) -> list[RssItem]:
     return items
 
 
+def latest_items(items: list[RssItem], has_pub_dates: bool, count: int) -> list[RssItem]:
+    """Return the newest count items in sorted_items order.
+
+    Selects with a bounded heap so large feeds are not fully sorted when only
+    the latest episodes_per_show items are needed.
+    """
+    if has_pub_dates:
+        return heapq.nlargest(
+            count,
+            items,
+            key=lambda item: item.pub_date if item.pub_date is not None else 0,
+        )
+    return items[:count]
+
+
 def rewrite_rss(
     rss_bytes: bytes,
     listen_host: str,
     listen_port: int,
     show_path: str,
-    cached_filenames: set[str],
+    cached_filenames: AbstractSet[str],
     episodes_per_show: int,
     strict_cached: bool,
+    parsed: ParsedRss | None = None,
 ) -> bytes:
-    """Rewrite enclosure URLs to localhost and filter items per README rules."""
-    tree, items = parse_rss_items(rss_bytes)
+    """Rewrite enclosure URLs to localhost and filter items per README rules.
+
+    parsed may carry an unused parse_rss_items(rss_bytes) result to skip
+    reparsing; the tree is modified in place, so it must not be reused.
+    """
+    tree, items, has_pub_dates = parsed if parsed is not None else parse_rss_items(rss_bytes)
     root = tree.getroot()
-    ordered_items = _sorted_items(items)
+    ordered_items = sorted_items(items, has_pub_dates)
+    media_base_url = f"http://{listen_host}:{listen_port}/media/{show_path}/"
     allowed_items: list[ElementTree.Element] = []
     for item in ordered_items:
         if len(allowed_items) >= episodes_per_show:
@@ -108,17 +184,11 @@ def rewrite_rss(
         if include:
             allowed_items.append(item.element)
             for enclosure, filename in nomadcast_enclosures:
-                encoded_filename = quote(filename, safe="")
-                enclosure.set(
-                    "url",
-                    f"http://{listen_host}:{listen_port}/media/{show_path}/{encoded_filename}",
-                )
+                enclosure.set("url", media_base_url + quote(filename, safe=""))
     channel = root.find("channel")
     if channel is not None:
-        for item in list(channel.findall("item")):
-            channel.remove(item)
-        for item in allowed_items:
-            channel.append(item)
+        # One slice assignment instead of a linear remove() per item.
+        channel[:] = [child for child in channel if child.tag != "item"] + allowed_items
     _rewrite_nomadcast_links(root, listen_host, listen_port)
     return ElementTree.tostring(root, encoding="utf-8")
 
@@ -143,8 +213,11 @@ def _rewrite_nomadcast_links(
     for element in root.iter():
         if element.text:
             element.text = _rewrite_nomadcast_value(element.text, listen_host, listen_port)
-        for key, value in element.attrib.items():
-            element.attrib[key] = _rewrite_nomadcast_value(value, listen_host, listen_port)
+        attrib = element.attrib
+        for key, value in attrib.items():
+            rewritten = _rewrite_nomadcast_value(value, listen_host, listen_port)
+            if rewritten is not value:
+                attrib[key] = rewritten
 
 
 def _rewrite_nomadcast_value(value: str, listen_host: str, listen_port: int) -> str:
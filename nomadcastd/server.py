@@ -13,13 +13,18 @@ import os
 import re
 from http import HTTPStatus
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import BinaryIO
 from urllib.parse import unquote, urlparse
 
 from nomadcastd.daemon import NomadCastDaemon
-from nomadcastd.parsing import decode_show_path, sanitize_filename
+from nomadcastd.parsing import sanitize_filename
 
 RANGE_RE = re.compile(r"bytes=(\d*)-(\d*)")
 
+_feed_logger = logging.getLogger("nomadcastd.feed")
+_media_logger = logging.getLogger("nomadcastd.media")
+_http_logger = logging.getLogger("nomadcastd.http")
+
 
 class NomadCastHTTPServer(ThreadingHTTPServer):
     """Threading HTTP server that exposes NomadCast daemon endpoints."""
@@ -73,23 +78,24 @@ class NomadCastRequestHandler(BaseHTTPRequestHandler):
         if show_id is None:
             return
         self.server.daemon.enqueue_refresh(show_id)
-        cached = self.server.daemon.get_cached_rss(show_id)
-        logger = logging.getLogger("nomadcastd.feed")
+        cached = self.server.daemon.get_cached_rss_fd(show_id)
         if cached is None:
             retry_after = self.server.daemon.config.rss_poll_seconds
-            logger.info(
+            _feed_logger.info(
                 "RSS cache miss for %s; refresh queued; retry_after=%s",
                 show_id,
                 retry_after,
             )
             self._send_feed_cache_miss(retry_after)
             return
-        logger.info("RSS cache hit for %s; bytes=%s", show_id, len(cached))
-        self.send_response(HTTPStatus.OK)
-        self.send_header("Content-Type", "application/rss+xml; charset=utf-8")
-        self.send_header("Content-Length", str(len(cached)))
-        self.end_headers()
-        self.wfile.write(cached)
+        fd, size = cached
+        with os.fdopen(fd, "rb") as handle:
+            _feed_logger.info("RSS cache hit for %s; bytes=%s", show_id, size)
+            self.send_response(HTTPStatus.OK)
+            self.send_header("Content-Type", "application/rss+xml; charset=utf-8")
+            self.send_header("Content-Length", str(size))
+            self.end_headers()
+            self._send_file(handle, 0, size)
 
     def _handle_media(self, path: str) -> None:
         """Serve cached media with Range support.
@@ -106,41 +112,50 @@ class NomadCastRequestHandler(BaseHTTPRequestHandler):
         if parsed_media is None:
             return
         show_id, filename = parsed_media
-        media_path = self.server.daemon.get_media_path(show_id, filename)
-        if media_path is None:
-            logging.getLogger("nomadcastd.media").info("Cache miss for %s/%s", show_id, filename)
+        media = self.server.daemon.get_media_fd(show_id, filename)
+        if media is None:
+            _media_logger.info("Cache miss for %s/%s", show_id, filename)
             self.server.daemon.enqueue_media_fetch(show_id, filename)
             self.send_error(HTTPStatus.NOT_FOUND, "Media not cached")
             return
-        logging.getLogger("nomadcastd.media").info("Cache hit for %s/%s", show_id, filename)
-        file_size = os.path.getsize(media_path)
-        range_header = self.headers.get("Range")
-        if range_header:
-            # README: accept byte ranges and respond with 206/416 as required.
-            range_result = _parse_range(range_header, file_size)
-            if range_result is None:
-                self.send_response(HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE)
-                self.send_header("Content-Range", f"bytes */{file_size}")
+        _media_logger.info("Cache hit for %s/%s", show_id, filename)
+        fd, file_size = media
+        with os.fdopen(fd, "rb") as handle:
+            range_header = self.headers.get("Range")
+            if range_header:
+                # README: accept byte ranges and respond with 206/416 as required.
+                range_result = _parse_range(range_header, file_size)
+                if range_result is None:
+                    self.send_response(HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE)
+                    self.send_header("Content-Range", f"bytes */{file_size}")
+                    self.end_headers()
+                    return
+                start, end = range_result
+                self.send_response(HTTPStatus.PARTIAL_CONTENT)
+                self.send_header("Accept-Ranges", "bytes")
+                self.send_header("Content-Type", "application/octet-stream")
+                self.send_header("Content-Range", f"bytes {start}-{end}/{file_size}")
+                self.send_header("Content-Length", str(end - start + 1))
                 self.end_headers()
+                self._send_file(handle, start, end - start + 1)
                 return
-            start, end = range_result
-            self.send_response(HTTPStatus.PARTIAL_CONTENT)
+            self.send_response(HTTPStatus.OK)
             self.send_header("Accept-Ranges", "bytes")
             self.send_header("Content-Type", "application/octet-stream")
-            self.send_header("Content-Range", f"bytes {start}-{end}/{file_size}")
-            self.send_header("Content-Length", str(end - start + 1))
+            self.send_header("Content-Length", str(file_size))
             self.end_headers()
-            with open(media_path, "rb") as handle:
-                handle.seek(start)
-                self.wfile.write(handle.read(end - start + 1))
-            return
-        self.send_response(HTTPStatus.OK)
-        self.send_header("Accept-Ranges", "bytes")
-        self.send_header("Content-Type", "application/octet-stream")
-        self.send_header("Content-Length", str(file_size))
-        self.end_headers()
-        with open(media_path, "rb") as handle:
-            self.wfile.write(handle.read())
+            self._send_file(handle, 0, file_size)
+
+    def _send_file(self, handle: BinaryIO, offset: int, count: int) -> None:
+        """Copy count bytes of handle starting at offset to the client.
+
+        socket.sendfile uses os.sendfile where available so media is copied
+        from the page cache to the socket without passing through Python, and
+        falls back to buffered send() elsewhere.
+        """
+        self.wfile.flush()
+        if count > 0:
+            self.connection.sendfile(handle, offset, count)
 
     def _extract_show_path(self, path: str, error_message: str) -> str | None:
         """Return the show path portion of a request path.
@@ -160,11 +175,6 @@ class NomadCastRequestHandler(BaseHTTPRequestHandler):
 
     def _resolve_show_id(self, show_path: str) -> str | None:
         """Validate a show path and resolve it to a show identifier."""
-        try:
-            decode_show_path(show_path)
-        except ValueError:
-            self.send_error(HTTPStatus.NOT_FOUND, "Invalid show path")
-            return None
         show_id = self.server.daemon.show_id_from_path(show_path)
         if not show_id:
             self.send_error(HTTPStatus.NOT_FOUND, "Invalid show path")
@@ -199,7 +209,7 @@ class NomadCastRequestHandler(BaseHTTPRequestHandler):
 
     def log_message(self, format: str, *args: object) -> None:
         """Route HTTP logs through the nomadcastd.http logger."""
-        logging.getLogger("nomadcastd.http").info("%s - %s", self.address_string(), format % args)
+        _http_logger.info("%s - %s", self.address_string(), format % args)
 
 
 def _parse_range(range_header: str, file_size: int) -> tuple[int, int] | None:
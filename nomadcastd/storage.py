@@ -11,11 +11,14 @@ The storage layout is:
     tmp/<filename>
 """
 
+import functools
 import json
 import os
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Iterable, TypedDict
+from typing import TypedDict
+
+_COMPACT_SEPARATORS = (",", ":")
 
 
 class ShowDirs(TypedDict):
@@ -24,7 +27,7 @@ class ShowDirs(TypedDict):
     tmp_dir: Path
 
 
-@dataclass
+@dataclass(slots=True)
 class CachedEpisode:
     """Metadata for a cached episode file.
 
@@ -38,26 +41,53 @@ class CachedEpisode:
     size_bytes: int
 
 
-@dataclass
+@dataclass(slots=True)
 class ShowState:
     """Persisted per-show state stored in state.json.
 
     The JSON representation is a dictionary with keys for subscription_uri,
-    show_name, last_refresh, last_error, failure_count, and cached_episodes.
-    cached_episodes is a list of CachedEpisode dictionaries.
+    show_name, last_refresh, last_error, failure_count, last_backoff,
+    last_rss_hash, last_rss_len, feed_poll_seconds, and cached_episodes.
+    feed_poll_seconds is the refresh interval the feed itself declares, or 0.
+    cached_episodes maps each filename to its CachedEpisode dictionary; older
+    list-shaped state files are still accepted on load.
     """
     subscription_uri: str
     show_name: str
     last_refresh: float | None = None
     last_error: str | None = None
     failure_count: int = 0
-    cached_episodes: list[CachedEpisode] = field(default_factory=list)
+    last_backoff: float = 0.0
+    last_rss_hash: str | None = None
+    last_rss_len: int = 0
+    feed_poll_seconds: int = 0
+    cached_episodes: dict[str, CachedEpisode] = field(default_factory=dict)
 
     def to_json(self) -> dict:
-        """Serialize the state to JSON-friendly primitives."""
-        data = asdict(self)
-        data["cached_episodes"] = [asdict(item) for item in self.cached_episodes]
-        return data
+        """Serialize the state to JSON-friendly primitives.
+
+        Fields are copied explicitly rather than through dataclasses.asdict,
+        whose recursive deep copy dominated the cost of each state flush.
+        """
+        return {
+            "subscription_uri": self.subscription_uri,
+            "show_name": self.show_name,
+            "last_refresh": self.last_refresh,
+            "last_error": self.last_error,
+            "failure_count": self.failure_count,
+            "last_backoff": self.last_backoff,
+            "last_rss_hash": self.last_rss_hash,
+            "last_rss_len": self.last_rss_len,
+            "feed_poll_seconds": self.feed_poll_seconds,
+            "cached_episodes": {
+                filename: {
+                    "filename": item.filename,
+                    "order_index": item.order_index,
+                    "size_bytes": item.size_bytes,
+                }
+                for filename, item in self.cached_episodes.items()
+            },
+        }
 
     @classmethod
     def from_json(cls, data: dict) -> "ShowState":
@@ -65,23 +95,36 @@ class ShowState:
 
         Missing fields are defaulted to empty/zero values.
         """
-        episodes = [CachedEpisode(**item) for item in data.get("cached_episodes", [])]
+        raw_episodes = data.get("cached_episodes", {})
+        # Older state.json files stored cached_episodes as a list.
+        if isinstance(raw_episodes, dict):
+            raw_episodes = raw_episodes.values()
+        episodes = {item["filename"]: CachedEpisode(**item) for item in raw_episodes}
         return cls(
             subscription_uri=data.get("subscription_uri", ""),
             show_name=data.get("show_name", ""),
             last_refresh=data.get("last_refresh"),
             last_error=data.get("last_error"),
             failure_count=data.get("failure_count", 0),
+            last_backoff=data.get("last_backoff", 0.0),
+            last_rss_hash=data.get("last_rss_hash"),
+            last_rss_len=data.get("last_rss_len", 0),
+            feed_poll_seconds=data.get("feed_poll_seconds", 0),
             cached_episodes=episodes,
         )
 
 
+@functools.lru_cache(maxsize=512)
 def show_directory(base_path: Path, destination_hash: str) -> Path:
     """Return the README-specified show directory path.
 
     Inputs:
         base_path: Root storage path from config.
         destination_hash: Reticulum destination hash used as the directory key.
+
+    Outputs:
+        The memoized show directory; reload and mirroring ask for the same
+        subscriptions repeatedly, and Path objects are immutable.
     """
     return base_path / "shows" / destination_hash
 
@@ -104,17 +147,23 @@ def ensure_show_dirs(show_dir: Path) -> ShowDirs:
     }
 
 
-def write_atomic(target_path: Path, data: bytes) -> None:
+def write_atomic(target_path: Path, data: bytes, *, durable: bool = True) -> None:
     """Write bytes atomically via a temp file + rename (README requirement).
 
+    Inputs:
+        durable: When False, skip the fsync. Use this only for files that can
+            be regenerated, such as the RSS feeds rebuilt on refresh.
+
     Side Effects:
-        Writes to <target>.tmp, fsyncs it, and replaces the target path.
+        Writes to <target>.tmp, fsyncs it when durable, and replaces the
+        target path.
     """
     tmp_path = target_path.with_suffix(target_path.suffix + ".tmp")
     with open(tmp_path, "wb") as handle:
         handle.write(data)
-        handle.flush()
-        os.fsync(handle.fileno())
+        if durable:
+            handle.flush()
+            os.fsync(handle.fileno())
     tmp_path.replace(target_path)
 
 
@@ -135,7 +184,7 @@ def load_show_state(state_path: Path, subscription_uri: str, show_name: str) ->
     """
     if state_path.exists():
         try:
-            data = json.loads(state_path.read_text(encoding="utf-8"))
+            data = json.loads(state_path.read_bytes())
             state = ShowState.from_json(data)
             if not state.subscription_uri:
                 state.subscription_uri = subscription_uri
@@ -148,18 +197,12 @@ def load_show_state(state_path: Path, subscription_uri: str, show_name: str) ->
 
 
 def save_show_state(state_path: Path, state: ShowState) -> None:
-    """Persist show state to state.json in canonical JSON format.
+    """Persist show state to state.json in compact JSON format.
+
+    The output is unindented so json can use its C encoder; indent forces the
+    pure-Python encoder and roughly triples serialization time.
 
     Side Effects:
         Writes the JSON file atomically using write_atomic.
     """
-    write_atomic(state_path, json.dumps(state.to_json(), indent=2).encode("utf-8"))
-
-
-def cached_episode_filenames(episodes: Iterable[CachedEpisode]) -> set[str]:
-    """Return the set of cached episode filenames.
-
-    Invariant:
-        Filenames are expected to correspond to files under episodes/.
-    """
-    return {episode.filename for episode in episodes}
+    write_atomic(state_path, json.dumps(state.to_json(), separators=_COMPACT_SEPARATORS).encode("utf-8"))
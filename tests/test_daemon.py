@@ -1,11 +1,15 @@
 import json
+import os
+import threading
 import time
 import unittest
 from pathlib import Path
 from tempfile import TemporaryDirectory
+from unittest import mock
 
+from nomadcastd import daemon as daemon_module
 from nomadcastd.config import NomadCastConfig
-from nomadcastd.daemon import NomadCastDaemon, ShowContext
+from nomadcastd.daemon import DaemonJob, JobType, NomadCastDaemon, ShowContext
 from nomadcastd.fetchers import MockFetcher
 from nomadcastd.parsing import parse_subscription_uri
 from nomadcastd.storage import CachedEpisode, ShowState, ensure_show_dirs, load_show_state, show_directory
@@ -26,7 +30,13 @@ class DaemonBehaviorTests(unittest.TestCase):
         """Dispose of temporary storage after each test."""
         self.temp_dir.cleanup()
 
-    def _build_daemon(self, max_bytes_per_show: int = 0, rss_poll_seconds: int = 900) -> NomadCastDaemon:
+    def _build_daemon(
+        self,
+        max_bytes_per_show: int = 0,
+        rss_poll_seconds: int = 900,
+        rss_rebuild_debounce_ms: int = 0,
+        min_free_bytes: int = 0,
+    ) -> NomadCastDaemon:
         """Create a daemon configured for test-friendly storage and limits."""
         config = NomadCastConfig(
             listen_host="127.0.0.1",
@@ -38,6 +48,9 @@ class DaemonBehaviorTests(unittest.TestCase):
             retry_backoff_seconds=300,
             max_bytes_per_show=max_bytes_per_show,
             public_host=None,
+            starter_pack_installed=False,
+            starter_pack_prompted=False,
+            starter_pack_pages_path=None,
             nomadnet_root=self.storage_path / "nomadnet",
             mirror_enabled=True,
             no_mirror_uris=set(),
@@ -45,6 +58,8 @@ class DaemonBehaviorTests(unittest.TestCase):
             reticulum_destination_app="nomadnetwork",
             reticulum_destination_aspects=("node",),
             config_path=self.storage_path / "config",
+            rss_rebuild_debounce_ms=rss_rebuild_debounce_ms,
+            min_free_bytes=min_free_bytes,
         )
         return NomadCastDaemon(config=config, fetcher=MockFetcher())
 
@@ -64,40 +79,184 @@ class DaemonBehaviorTests(unittest.TestCase):
             state_path=show_dir / "state.json",
             state=state,
         )
-        daemon.show_contexts[subscription.show_id] = context
+        daemon.show_contexts = {**daemon.show_contexts, subscription.show_id: context}
         return subscription.show_id, context
 
+    def _record_refreshes(self, daemon: NomadCastDaemon) -> list[str]:
+        """Capture refresh submissions instead of running them on the pool."""
+        submitted: list[str] = []
+        daemon._refresh_pool.submit = lambda _fn, show_id: submitted.append(show_id)  # type: ignore[method-assign]
+        return submitted
+
     def test_refresh_debounce_respects_polling_and_pending(self) -> None:
         """Ensure refresh enqueueing respects debounce/polling/backoff rules."""
         daemon = self._build_daemon(rss_poll_seconds=900)
         show_id, context = self._add_show(daemon)
+        submitted = self._record_refreshes(daemon)
 
         # A recent refresh should skip enqueueing.
-        context.state.last_refresh = time.time()
+        context.last_refresh_monotonic = time.monotonic()
         daemon.enqueue_refresh(show_id)
-        self.assertEqual(daemon.queue.qsize(), 0)
+        self.assertEqual(len(submitted), 0)
 
         # A future backoff window should also skip enqueueing.
-        context.state.last_refresh = None
-        context.next_refresh_time = time.time() + 60
+        context.last_refresh_monotonic = None
+        context.next_refresh_monotonic = time.monotonic() + 60
         daemon.enqueue_refresh(show_id)
-        self.assertEqual(daemon.queue.qsize(), 0)
+        self.assertEqual(len(submitted), 0)
 
         # With no backoff and no pending refresh, enqueue once.
-        context.next_refresh_time = 0
+        context.next_refresh_monotonic = 0
+        daemon.enqueue_refresh(show_id)
+        daemon.enqueue_refresh(show_id)
+        self.assertEqual(len(submitted), 1)
+
+    def test_persisted_last_refresh_seeds_monotonic_poll_window(self) -> None:
+        """A last_refresh loaded from state.json should still throttle polling."""
+        daemon = self._build_daemon(rss_poll_seconds=900)
+        show_id, context = self._add_show(daemon)
+        context.state.last_refresh = time.time() - 60
+        reloaded = ShowContext(
+            subscription=context.subscription,
+            show_dir=context.show_dir,
+            episodes_dir=context.episodes_dir,
+            tmp_dir=context.tmp_dir,
+            state_path=context.state_path,
+            state=context.state,
+        )
+        daemon.show_contexts = {show_id: reloaded}
+
+        self.assertIsNotNone(reloaded.last_refresh_monotonic)
+        submitted = self._record_refreshes(daemon)
         daemon.enqueue_refresh(show_id)
+        self.assertEqual(len(submitted), 0)
+
+    def test_refresh_honors_feed_declared_ttl(self) -> None:
+        """A feed <ttl> longer than rss_poll_seconds should delay polling."""
+        daemon = self._build_daemon(rss_poll_seconds=60)
+        daemon.fetcher = MockFetcher(rss_payload=b"<rss><channel><ttl>120</ttl></channel></rss>")
+        show_id, context = self._add_show(daemon)
+
+        daemon._handle_refresh(show_id)
+        self.assertEqual(context.state.feed_poll_seconds, 7200)
+        submitted = self._record_refreshes(daemon)
+        context.last_refresh_monotonic = time.monotonic() - 600
+        daemon.enqueue_refresh(show_id)
+        self.assertEqual(len(submitted), 0)
+
+        context.last_refresh_monotonic = time.monotonic() - 7201
+        daemon.enqueue_refresh(show_id)
+        self.assertEqual(len(submitted), 1)
+
+    def test_reload_config_keeps_unsaved_show_state(self) -> None:
+        """Dirty in-memory state should survive a config reload."""
+        daemon = self._build_daemon()
+        subscription = parse_subscription_uri("nomadcast:a7c3e9b14f2d6a80715c9e3b1a4d8f20:BestShow")
+        daemon.config.config_path.write_text(
+            f"[nomadcast]\nstorage_path = {self.storage_path}\n\n"
+            f"[subscriptions]\nuri = {subscription.uri}\n\n"
+            f"[mirroring]\nnomadnet_root = {self.storage_path / 'nomadnet'}\n",
+            encoding="utf-8",
+        )
+        daemon.reload_config()
+        context = daemon.show_contexts[subscription.show_id]
+        context.state.cached_episodes["ep.mp3"] = CachedEpisode(filename="ep.mp3", order_index=0, size_bytes=3)
+        context.state_dirty = True
+
+        daemon.reload_config()
+
+        self.assertIn("ep.mp3", daemon.show_contexts[subscription.show_id].state.cached_episodes)
+
+    def test_reload_config_swaps_state_under_context_lock(self) -> None:
+        """Media pool updates must not slip between the state flush and the swap."""
+        daemon = self._build_daemon()
+        subscription = parse_subscription_uri("nomadcast:a7c3e9b14f2d6a80715c9e3b1a4d8f20:BestShow")
+        daemon.config.config_path.write_text(
+            f"[nomadcast]\nstorage_path = {self.storage_path}\n\n"
+            f"[subscriptions]\nuri = {subscription.uri}\n\n"
+            f"[mirroring]\nnomadnet_root = {self.storage_path / 'nomadnet'}\n",
+            encoding="utf-8",
+        )
+        daemon.reload_config()
+        context = daemon.show_contexts[subscription.show_id]
+        lock_held: list[bool] = []
+
+        def load_while_recording(*args: object) -> ShowState:
+            lock_held.append(context.lock.locked())
+            return load_show_state(*args)  # type: ignore[arg-type]
+
+        with mock.patch.object(daemon_module, "load_show_state", load_while_recording):
+            daemon.reload_config()
+
+        self.assertEqual(lock_held, [True])
+
+    def test_reload_config_prepares_every_subscription(self) -> None:
+        """Pooled reloads should build one context per subscription, in order."""
+        daemon = self._build_daemon()
+        uris = [
+            "nomadcast:a7c3e9b14f2d6a80715c9e3b1a4d8f20:BestShow",
+            "nomadcast:0b1c2d3e4f5061728394a5b6c7d8e9f0:OtherShow",
+            "nomadcast:ffeeddccbbaa99887766554433221100:ThirdShow",
+        ]
+        uri_lines = "".join(f"uri = {uri}\n" for uri in uris)
+        daemon.config.config_path.write_text(
+            f"[nomadcast]\nstorage_path = {self.storage_path}\n\n"
+            f"[subscriptions]\n{uri_lines}\n"
+            f"[mirroring]\nnomadnet_root = {self.storage_path / 'nomadnet'}\n",
+            encoding="utf-8",
+        )
+
+        daemon.reload_config()
+
+        show_ids = [parse_subscription_uri(uri).show_id for uri in uris]
+        self.assertEqual(list(daemon.show_contexts), show_ids)
+        for show_id in show_ids:
+            context = daemon.show_contexts[show_id]
+            self.assertTrue(context.episodes_dir.is_dir())
+            self.assertEqual(context.state.subscription_uri, context.subscription.uri)
+
+    def test_refresh_jobs_run_on_refresh_pool(self) -> None:
+        """Refreshes should bypass the worker queue and run on the refresh pool."""
+        daemon = self._build_daemon()
+        show_id, _ = self._add_show(daemon)
+        threads: list[str] = []
+        daemon._handle_refresh = lambda _show_id: threads.append(threading.current_thread().name)  # type: ignore[method-assign]
+
         daemon.enqueue_refresh(show_id)
-        self.assertEqual(daemon.queue.qsize(), 1)
+        daemon._refresh_pool.shutdown(wait=True)
+
+        self.assertEqual(len(daemon._jobs), 0)
+        self.assertEqual(len(threads), 1)
+        self.assertTrue(threads[0].startswith("nomadcast-refresh"))
+
+    def test_media_jobs_popped_after_stop_are_dropped(self) -> None:
+        """Dispatching media after the pool shut down should not kill the worker."""
+        daemon = self._build_daemon()
+        show_id, _ = self._add_show(daemon)
+        daemon._media_pool.shutdown()
+
+        daemon._dispatch_media_batch(DaemonJob(JobType.MEDIA_BATCH, show_id, ("ep.mp3",)))
+
+    def test_enqueue_media_batch_skips_pending_filenames(self) -> None:
+        """Batch media enqueueing should de-duplicate against pending fetches."""
+        daemon = self._build_daemon()
+        show_id, context = self._add_show(daemon)
+
+        daemon.enqueue_media_fetch(show_id, "a.mp3")
+        daemon._enqueue_media_batch(show_id, ["a.mp3", "b.mp3", "b.mp3", "c.mp3"])
+
+        self.assertEqual([job.payload for job in daemon._jobs], ["a.mp3", ("b.mp3", "c.mp3")])
+        self.assertEqual(context.media_pending, {"a.mp3", "b.mp3", "c.mp3"})
 
     def test_register_failure_sets_backoff_and_persists_state(self) -> None:
         """Verify failure registration updates backoff and state.json."""
         daemon = self._build_daemon()
         _, context = self._add_show(daemon)
 
-        start = time.time()
+        start = time.monotonic()
         daemon._register_failure(context, "boom")
 
-        self.assertGreaterEqual(context.next_refresh_time, start)
+        self.assertGreaterEqual(context.next_refresh_monotonic, start)
         self.assertEqual(context.state.failure_count, 1)
         self.assertEqual(context.state.last_error, "boom")
         self.assertTrue(context.state_path.exists())
@@ -105,6 +264,53 @@ class DaemonBehaviorTests(unittest.TestCase):
         self.assertEqual(saved.failure_count, 1)
         self.assertEqual(saved.last_error, "boom")
 
+    def test_load_cached_episodes_drops_stale_media(self) -> None:
+        """Reconciling after refresh should delete files outside the order map."""
+        daemon = self._build_daemon()
+        _, context = self._add_show(daemon)
+        (context.episodes_dir / "keep.mp3").write_bytes(b"1234")
+        (context.episodes_dir / "stale.mp3").write_bytes(b"12")
+        (context.episodes_dir / "subdir").mkdir()
+
+        cached = daemon._load_cached_episodes(context, {"keep.mp3": 1, "missing.mp3": 0})
+
+        self.assertEqual(list(cached), ["keep.mp3"])
+        self.assertEqual(cached["keep.mp3"].order_index, 1)
+        self.assertEqual(cached["keep.mp3"].size_bytes, 4)
+        self.assertFalse((context.episodes_dir / "stale.mp3").exists())
+        self.assertTrue((context.episodes_dir / "subdir").is_dir())
+
+    def test_register_failure_backoff_uses_decorrelated_jitter(self) -> None:
+        """Each backoff should stay between the base and 3x the previous one."""
+        daemon = self._build_daemon()
+        _, context = self._add_show(daemon)
+        base = daemon.config.retry_backoff_seconds
+
+        previous = 0.0
+        for _ in range(10):
+            daemon._register_failure(context, "boom")
+            backoff = context.state.last_backoff
+            self.assertGreaterEqual(backoff, base)
+            self.assertLessEqual(backoff, min(base * 60, max(base, (previous or base) * 3)))
+            previous = backoff
+        saved = load_show_state(context.state_path, context.subscription.uri, context.subscription.show_name)
+        self.assertEqual(saved.last_backoff, previous)
+
+    def test_first_failure_backoff_is_jittered(self) -> None:
+        """Shows failing for the first time should not all retry after exactly the base."""
+        daemon = self._build_daemon()
+        _, context = self._add_show(daemon)
+        base = daemon.config.retry_backoff_seconds
+
+        backoffs = set()
+        for _ in range(20):
+            context.state.last_backoff = 0.0
+            daemon._register_failure(context, "boom")
+            backoffs.add(context.state.last_backoff)
+
+        self.assertGreater(len(backoffs), 1)
+        self.assertTrue(all(base <= backoff <= base * 3 for backoff in backoffs))
+
     def test_cache_eviction_removes_oldest_media_and_updates_state(self) -> None:
         """Ensure max_bytes_per_show evicts oldest cached media."""
         daemon = self._build_daemon(max_bytes_per_show=10)
@@ -116,19 +322,335 @@ class DaemonBehaviorTests(unittest.TestCase):
         oldest.write_bytes(b"12345")
 
         # Order index 0 is newest; larger order_index is older.
-        context.state.cached_episodes = [
-            CachedEpisode(filename="newest.mp3", order_index=0, size_bytes=4),
-            CachedEpisode(filename="oldest.mp3", order_index=1, size_bytes=5),
-        ]
+        context.state.cached_episodes = {
+            "newest.mp3": CachedEpisode(filename="newest.mp3", order_index=0, size_bytes=4),
+            "oldest.mp3": CachedEpisode(filename="oldest.mp3", order_index=1, size_bytes=5),
+        }
+        context.cached_total_bytes = 9
 
         allowed = daemon._ensure_space_for(context, new_size=6)
 
         self.assertTrue(allowed)
         self.assertTrue(newest.exists())
         self.assertFalse(oldest.exists())
-        self.assertEqual([item.filename for item in context.state.cached_episodes], ["newest.mp3"])
+        self.assertEqual(list(context.state.cached_episodes), ["newest.mp3"])
+        self.assertEqual(context.cached_total_bytes, 4)
+        self.assertTrue(context.state_dirty)
+        daemon._flush_if_dirty(context)
+        self.assertFalse(context.state_dirty)
         persisted = json.loads(context.state_path.read_text(encoding="utf-8"))
-        self.assertEqual([item["filename"] for item in persisted["cached_episodes"]], ["newest.mp3"])
+        self.assertEqual(list(persisted["cached_episodes"]), ["newest.mp3"])
+
+    def test_cache_eviction_pops_oldest_episodes_until_space_fits(self) -> None:
+        """Eviction should remove only as many of the oldest episodes as needed."""
+        daemon = self._build_daemon(max_bytes_per_show=12)
+        _, context = self._add_show(daemon)
+        for order_index in range(4):
+            filename = f"ep{order_index}.mp3"
+            (context.episodes_dir / filename).write_bytes(b"123")
+            context.state.cached_episodes[filename] = CachedEpisode(
+                filename=filename,
+                order_index=order_index,
+                size_bytes=3,
+            )
+        context.cached_total_bytes = 12
+
+        allowed = daemon._ensure_space_for(context, new_size=6)
+
+        self.assertTrue(allowed)
+        self.assertEqual(sorted(context.state.cached_episodes), ["ep0.mp3", "ep1.mp3"])
+        self.assertEqual(context.cached_total_bytes, 6)
+        self.assertFalse((context.episodes_dir / "ep2.mp3").exists())
+        self.assertFalse((context.episodes_dir / "ep3.mp3").exists())
+
+    def test_cache_eviction_keeps_cache_when_payload_exceeds_limit(self) -> None:
+        """Payloads larger than the whole budget should not evict anything."""
+        daemon = self._build_daemon(max_bytes_per_show=10)
+        _, context = self._add_show(daemon)
+        (context.episodes_dir / "ep.mp3").write_bytes(b"123")
+        context.state.cached_episodes["ep.mp3"] = CachedEpisode(filename="ep.mp3", order_index=0, size_bytes=3)
+        context.cached_total_bytes = 3
+
+        allowed = daemon._ensure_space_for(context, new_size=11)
+
+        self.assertFalse(allowed)
+        self.assertEqual(list(context.state.cached_episodes), ["ep.mp3"])
+        self.assertTrue((context.episodes_dir / "ep.mp3").exists())
+        self.assertFalse(context.state_dirty)
+
+    def test_media_fetch_streams_payload_into_episodes(self) -> None:
+        """Media fetches should land in episodes/ and update cached state."""
+        daemon = self._build_daemon()
+        daemon.fetcher = MockFetcher(media_payload=b"episode-bytes")
+        show_id, context = self._add_show(daemon)
+
+        daemon._handle_media_fetch(show_id, "ep.mp3")
+
+        self.assertEqual((context.episodes_dir / "ep.mp3").read_bytes(), b"episode-bytes")
+        self.assertFalse((context.tmp_dir / "ep.mp3").exists())
+        self.assertEqual(context.state.cached_episodes["ep.mp3"].size_bytes, 13)
+        self.assertEqual(context.cached_total_bytes, 13)
+        self.assertFalse(context.state_dirty)
+
+    def test_failed_media_fetch_removes_partial_tmp_file(self) -> None:
+        """A fetch that fails mid-stream should not leave its tmp file behind."""
+        daemon = self._build_daemon()
+        show_id, context = self._add_show(daemon)
+
+        def fail_midway(destination_hash: str, resource_path: str, dest: Path, **_kwargs: object) -> int:
+            dest.write_bytes(b"partial")
+            raise TimeoutError("stalled")
+
+        daemon.fetcher.fetch_to_file = fail_midway  # type: ignore[method-assign]
+
+        daemon._handle_media_fetch(show_id, "ep.mp3")
+
+        self.assertFalse((context.tmp_dir / "ep.mp3").exists())
+        self.assertEqual(context.state.failure_count, 1)
+
+    def test_stop_during_media_fetch_does_not_record_failure(self) -> None:
+        """A download cut off by stop() closing the fetcher is not a show failure."""
+        daemon = self._build_daemon()
+        show_id, context = self._add_show(daemon)
+        started = threading.Event()
+        closed = threading.Event()
+
+        def fetch_until_closed(destination_hash: str, resource_path: str, dest: Path, **_kwargs: object) -> int:
+            started.set()
+            closed.wait(timeout=5)
+            raise RuntimeError("link closed")
+
+        daemon.fetcher.fetch_to_file = fetch_until_closed  # type: ignore[method-assign]
+        daemon.fetcher.close = closed.set  # type: ignore[method-assign]
+        daemon.worker_thread.start()
+        future = daemon._media_pool.submit(daemon._handle_media_fetch, show_id, "ep.mp3")
+        self.assertTrue(started.wait(timeout=5))
+
+        daemon.stop()
+        future.result(timeout=5)
+
+        self.assertEqual(context.state.failure_count, 0)
+        self.assertIsNone(context.state.last_error)
+        self.assertFalse(context.state_path.exists())
+
+    def _seed_episodes(self, context: ShowContext, count: int, size: int) -> None:
+        """Cache count episodes of size bytes, ep0.mp3 being the newest."""
+        for order_index in range(count):
+            filename = f"ep{order_index}.mp3"
+            (context.episodes_dir / filename).write_bytes(b"x" * size)
+            context.state.cached_episodes[filename] = CachedEpisode(
+                filename=filename,
+                order_index=order_index,
+                size_bytes=size,
+            )
+        context.cached_total_bytes = count * size
+
+    def test_media_fetch_evicts_oldest_to_keep_min_free_bytes(self) -> None:
+        """Low filesystem free space should evict only the oldest episodes needed."""
+        daemon = self._build_daemon(min_free_bytes=9)
+        daemon.fetcher = MockFetcher(media_payload=b"new")
+        show_id, context = self._add_show(daemon)
+        self._seed_episodes(context, count=4, size=3)
+        daemon._free_space = (time.monotonic(), 5)
+
+        daemon._handle_media_fetch(show_id, "new.mp3")
+
+        self.assertEqual(sorted(context.state.cached_episodes), ["ep0.mp3", "ep1.mp3", "new.mp3"])
+        self.assertFalse((context.episodes_dir / "ep3.mp3").exists())
+        self.assertEqual(daemon._free_space[1], 8)
+
+    def test_media_fetch_skips_when_min_free_bytes_unreachable(self) -> None:
+        """A fetch that cannot reach min_free_bytes should not start or evict."""
+        daemon = self._build_daemon(min_free_bytes=100)
+        daemon.fetcher = MockFetcher(media_payload=b"new")
+        show_id, context = self._add_show(daemon)
+        self._seed_episodes(context, count=2, size=3)
+        daemon._free_space = (time.monotonic(), 5)
+
+        daemon._handle_media_fetch(show_id, "new.mp3")
+
+        self.assertEqual(sorted(context.state.cached_episodes), ["ep0.mp3", "ep1.mp3"])
+        self.assertTrue((context.episodes_dir / "ep1.mp3").exists())
+        self.assertEqual(context.cached_total_bytes, 6)
+        self.assertFalse((context.episodes_dir / "new.mp3").exists())
+        self.assertFalse((context.tmp_dir / "new.mp3").exists())
+
+    def test_media_completions_share_one_debounced_publish(self) -> None:
+        """Back-to-back publish requests inside the window should coalesce."""
+        daemon = self._build_daemon(rss_rebuild_debounce_ms=60_000)
+        _, context = self._add_show(daemon)
+        published: list[ShowContext] = []
+        daemon._publish_show = published.append  # type: ignore[method-assign]
+
+        for _ in range(3):
+            daemon._schedule_publish(context)
+
+        self.assertEqual(published, [])
+        self.assertIsNotNone(context.publish_timer)
+        daemon._flush_pending_publish(context)
+        self.assertEqual(published, [context])
+        self.assertIsNone(context.publish_timer)
+
+    def test_debounced_publish_flushes_media_state_once(self) -> None:
+        """With a publish pending, media state should be saved by the publish."""
+        daemon = self._build_daemon(rss_rebuild_debounce_ms=60_000)
+        daemon.fetcher = MockFetcher(media_payload=b"episode-bytes")
+        show_id, context = self._add_show(daemon)
+
+        daemon._handle_media_fetch(show_id, "a.mp3")
+        daemon._handle_media_fetch(show_id, "b.mp3")
+
+        self.assertTrue(context.state_dirty)
+        self.assertFalse(context.state_path.exists())
+        context.publish_timer.cancel()
+        daemon._run_scheduled_publish(context)
+        self.assertFalse(context.state_dirty)
+        saved = load_show_state(context.state_path, context.subscription.uri, context.subscription.show_name)
+        self.assertEqual(sorted(saved.cached_episodes), ["a.mp3", "b.mp3"])
+
+    def test_media_fetch_aborts_when_episode_exceeds_show_limit(self) -> None:
+        """Episodes larger than max_bytes_per_show should be skipped mid-stream."""
+        daemon = self._build_daemon(max_bytes_per_show=5)
+        daemon.fetcher = MockFetcher(media_payload=b"0123456789")
+        show_id, context = self._add_show(daemon)
+
+        daemon._handle_media_fetch(show_id, "big.mp3")
+
+        self.assertFalse((context.episodes_dir / "big.mp3").exists())
+        self.assertFalse((context.tmp_dir / "big.mp3").exists())
+        self.assertEqual(context.state.cached_episodes, {})
+        self.assertEqual(context.state.failure_count, 0)
+
+    def test_refresh_skips_rewriting_unchanged_publisher_rss(self) -> None:
+        """An identical feed should not rewrite publisher_rss.xml."""
+        daemon = self._build_daemon()
+        daemon.fetcher = MockFetcher(rss_payload=b"<rss><channel><title>Show</title></channel></rss>")
+        show_id, context = self._add_show(daemon)
+        publisher_path = context.show_dir / "publisher_rss.xml"
+
+        daemon._handle_refresh(show_id)
+        self.assertIsNone(context.state.last_error)
+        self.assertEqual(context.state.last_rss_len, len(daemon.fetcher.rss_payload))
+        os.utime(publisher_path, ns=(0, 0))
+
+        daemon._handle_refresh(show_id)
+        self.assertEqual(publisher_path.stat().st_mtime_ns, 0)
+
+    def test_refresh_keeps_media_promoted_during_reconcile(self) -> None:
+        """Episodes cached after the directory scan should survive refresh."""
+        daemon = self._build_daemon()
+        daemon.fetcher = MockFetcher(
+            rss_payload=(
+                b"<rss><channel><item><enclosure "
+                b'url="nomadcast:a7c3e9b14f2d6a80715c9e3b1a4d8f20:BestShow/media/late.mp3" />'
+                b"</item></channel></rss>"
+            )
+        )
+        show_id, context = self._add_show(daemon)
+        scan = daemon._load_cached_episodes
+
+        def scan_then_promote(ctx: ShowContext, order_map: dict[str, int]) -> dict[str, CachedEpisode]:
+            cached = scan(ctx, order_map)
+            (ctx.episodes_dir / "late.mp3").write_bytes(b"1234")
+            with ctx.lock:
+                ctx.state.cached_episodes["late.mp3"] = CachedEpisode(filename="late.mp3", order_index=0, size_bytes=4)
+                ctx.scan_changes.add("late.mp3")
+            return cached
+
+        daemon._load_cached_episodes = scan_then_promote  # type: ignore[method-assign]
+        daemon._handle_refresh(show_id)
+
+        self.assertIsNone(context.state.last_error)
+        self.assertEqual(list(context.state.cached_episodes), ["late.mp3"])
+        self.assertEqual(context.cached_total_bytes, 4)
+
+    def test_refresh_drops_media_evicted_during_reconcile(self) -> None:
+        """Episodes evicted after the directory scan should not be re-added."""
+        daemon = self._build_daemon()
+        daemon.fetcher = MockFetcher(
+            rss_payload=(
+                b"<rss><channel><item><enclosure "
+                b'url="nomadcast:a7c3e9b14f2d6a80715c9e3b1a4d8f20:BestShow/media/ep0.mp3" />'
+                b"</item></channel></rss>"
+            )
+        )
+        show_id, context = self._add_show(daemon)
+        self._seed_episodes(context, count=1, size=3)
+        scan = daemon._load_cached_episodes
+
+        def scan_then_evict(ctx: ShowContext, order_map: dict[str, int]) -> dict[str, CachedEpisode]:
+            cached = scan(ctx, order_map)
+            with ctx.lock:
+                daemon._evict_oldest(ctx, 0)
+            return cached
+
+        daemon._load_cached_episodes = scan_then_evict  # type: ignore[method-assign]
+        daemon._handle_refresh(show_id)
+
+        self.assertIsNone(context.state.last_error)
+        self.assertEqual(context.state.cached_episodes, {})
+        self.assertEqual(context.cached_total_bytes, 0)
+        self.assertIsNone(context.scan_changes)
+
+    def test_refresh_reuses_selection_for_unchanged_feed(self) -> None:
+        """An unchanged feed should not be reparsed, but missing media is requeued."""
+        daemon = self._build_daemon()
+        daemon.fetcher = MockFetcher(
+            rss_payload=(
+                b"<rss><channel><item><enclosure "
+                b'url="nomadcast:a7c3e9b14f2d6a80715c9e3b1a4d8f20:BestShow/media/ep.mp3" />'
+                b"</item></channel></rss>"
+            )
+        )
+        show_id, context = self._add_show(daemon)
+        select = daemon._select_episodes
+        calls: list[str] = []
+
+        def counting_select(ctx: ShowContext, rss_bytes: bytes) -> tuple:
+            calls.append(ctx.subscription.show_id)
+            return select(ctx, rss_bytes)
+
+        daemon._select_episodes = counting_select  # type: ignore[method-assign]
+        daemon._handle_refresh(show_id)
+        context.media_pending.clear()
+        daemon._jobs.clear()
+        daemon._handle_refresh(show_id)
+
+        self.assertEqual(calls, [show_id])
+        self.assertEqual(context.order_map, {"ep.mp3": 0})
+        self.assertEqual([job.payload for job in daemon._jobs], [("ep.mp3",)])
+
+    def test_refresh_rewrites_truncated_publisher_rss(self) -> None:
+        """A publisher_rss.xml truncated on disk should be rewritten."""
+        daemon = self._build_daemon()
+        daemon.fetcher = MockFetcher(rss_payload=b"<rss><channel><title>Show</title></channel></rss>")
+        show_id, context = self._add_show(daemon)
+        publisher_path = context.show_dir / "publisher_rss.xml"
+
+        daemon._handle_refresh(show_id)
+        publisher_path.write_bytes(b"")
+        daemon._handle_refresh(show_id)
+
+        self.assertEqual(publisher_path.read_bytes(), daemon.fetcher.rss_payload)
+
+    def test_rebuild_client_rss_skips_unchanged_inputs(self) -> None:
+        """Client RSS should only be rewritten when its inputs change."""
+        daemon = self._build_daemon()
+        _, context = self._add_show(daemon)
+        context.publisher_rss_bytes = b"<rss><channel><title>Show</title></channel></rss>"
+        context.state.last_rss_hash = "hash-1"
+        client_path = context.show_dir / "client_rss.xml"
+
+        daemon._rebuild_client_rss(context)
+        self.assertTrue(client_path.exists())
+
+        client_path.unlink()
+        daemon._rebuild_client_rss(context)
+        self.assertFalse(client_path.exists())
+
+        context.state.last_rss_hash = "hash-2"
+        daemon._rebuild_client_rss(context)
+        self.assertTrue(client_path.exists())
 
 
 if __name__ == "__main__":
@@ -0,0 +1,99 @@
+import logging
+import threading
+import time
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from nomadcastd import fetchers
+from nomadcastd.fetchers import ReticulumFetcher
+
+
+class FakeDownloader:
+    """NomadnetDownloader stand-in that reports progress, then optionally succeeds."""
+
+    progress_ticks = 0
+    succeed = True
+
+    def __init__(self, rns, destination_hash, path, data, on_success, on_failure, on_progress, **_kwargs) -> None:
+        self.on_success = on_success
+        self.on_progress = on_progress
+
+    def download(self) -> None:
+        threading.Thread(target=self._run, daemon=True).start()
+
+    def _run(self) -> None:
+        for tick in range(self.progress_ticks):
+            time.sleep(0.05)
+            self.on_progress(tick / self.progress_ticks)
+        if self.succeed:
+            self.on_success(SimpleNamespace(response=b"payload"))
+
+
+class ReticulumFetchTimeoutTests(unittest.TestCase):
+    """Validate the idle deadline applied to Reticulum fetches."""
+
+    def setUp(self) -> None:
+        """Build a fetcher without loading RNS."""
+        self.fetcher = ReticulumFetcher.__new__(ReticulumFetcher)
+        self.fetcher.logger = logging.getLogger("nomadcastd.fetchers")
+        self.fetcher._rns = SimpleNamespace()
+        self.fetcher.config_dir = None
+        self.fetcher.destination_app = "nomadnetwork"
+        self.fetcher.destination_aspects = ("node",)
+        self.fetcher._request_timeout_seconds = 0.2
+
+    def _fetch_with(self, progress_ticks: int, succeed: bool) -> bytes:
+        downloader = type("Downloader", (FakeDownloader,), {"progress_ticks": progress_ticks, "succeed": succeed})
+        with mock.patch.object(fetchers, "NomadnetDownloader", downloader):
+            return self.fetcher._fetch("ab" * 16, "/file/show/feed.rss", lambda receipt: receipt.response)
+
+    def test_progress_extends_deadline(self) -> None:
+        """A transfer that keeps reporting progress may outlast the request timeout."""
+        self.assertEqual(self._fetch_with(progress_ticks=8, succeed=True), b"payload")
+
+    def test_receipt_is_handled_on_calling_thread(self) -> None:
+        """Writing the payload should not run on the Reticulum callback thread."""
+        downloader = type("Downloader", (FakeDownloader,), {"progress_ticks": 0, "succeed": True})
+        threads: list[threading.Thread] = []
+
+        def handle(receipt: SimpleNamespace) -> bytes:
+            threads.append(threading.current_thread())
+            return receipt.response
+
+        with mock.patch.object(fetchers, "NomadnetDownloader", downloader):
+            self.fetcher._fetch("ab" * 16, "/file/show/media/ep.mp3", handle)
+
+        self.assertEqual(threads, [threading.current_thread()])
+
+    def test_silent_request_times_out_after_request_timeout(self) -> None:
+        """A request with no response or progress should fail after one timeout."""
+        start = time.monotonic()
+        with self.assertRaises(TimeoutError):
+            self._fetch_with(progress_ticks=0, succeed=False)
+        self.assertLess(time.monotonic() - start, 1.0)
+
+
+class ReticulumPrewarmTests(unittest.TestCase):
+    """Validate path prewarming for subscribed destinations."""
+
+    def test_prewarm_requests_missing_paths_only(self) -> None:
+        """Known paths and invalid hashes should not trigger path requests."""
+        known = bytes.fromhex("aa" * 16)
+        requested: list[bytes] = []
+        fetcher = ReticulumFetcher.__new__(ReticulumFetcher)
+        fetcher.logger = logging.getLogger("nomadcastd.fetchers")
+        fetcher._rns = SimpleNamespace(
+            Transport=SimpleNamespace(
+                has_path=lambda destination_hash: destination_hash == known,
+                request_path=requested.append,
+            )
+        )
+
+        fetcher.prewarm(["aa" * 16, "bb" * 16, "not-hex"])
+
+        self.assertEqual(requested, [bytes.fromhex("bb" * 16)])
+
+
+if __name__ == "__main__":
+    unittest.main()
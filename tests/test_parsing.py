@@ -3,7 +3,9 @@ import unittest
 from nomadcastd.parsing import (
     decode_show_path,
     encode_show_path,
+    media_url_prefixes,
     normalize_subscription_input,
+    parse_nomadcast_media_url,
     parse_subscription_uri,
 )
 
@@ -44,6 +46,17 @@ class ParsingTests(unittest.TestCase):
             "nomadcast:a7c3e9b14f2d6a80715c9e3b1a4d8f20:BestShow",
         )
 
+    def test_media_url_prefixes_match_parsed_media_urls(self) -> None:
+        destination = "a7c3e9b14f2d6a80715c9e3b1a4d8f20"
+        prefixes = media_url_prefixes(destination, "BestShow")
+        for url in (
+            f"nomadcast:{destination}:BestShow/media/ep%201.mp3",
+            f"nomadcast://{destination}:BestShow/media/ep%201.mp3",
+        ):
+            self.assertTrue(url.startswith(prefixes))
+            self.assertEqual(parse_nomadcast_media_url(url), (destination, "BestShow", "ep 1.mp3"))
+        self.assertFalse(f"nomadcast:{destination}:OtherShow/media/ep.mp3".startswith(prefixes))
+
 
 if __name__ == "__main__":
     unittest.main()
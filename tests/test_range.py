@@ -27,6 +27,9 @@ class RangeTests(unittest.TestCase):
             retry_backoff_seconds=300,
             max_bytes_per_show=0,
             public_host=None,
+            starter_pack_installed=False,
+            starter_pack_prompted=False,
+            starter_pack_pages_path=None,
             nomadnet_root=storage_path / "nomadnet",
             mirror_enabled=True,
             no_mirror_uris=set(),
@@ -50,7 +53,7 @@ class RangeTests(unittest.TestCase):
             state_path=show_dir / "state.json",
             state=state,
         )
-        self.daemon.show_contexts[subscription.show_id] = context
+        self.daemon.show_contexts = {subscription.show_id: context}
         self.filename: str = "episode.mp3"
         (context.episodes_dir / self.filename).write_bytes(b"hello world")
         self.show_path: str = encode_show_path(subscription.destination_hash, subscription.show_name)
@@ -79,6 +82,16 @@ class RangeTests(unittest.TestCase):
         self.assertEqual(body, b"hello")
         conn.close()
 
+    def test_full_media_request(self) -> None:
+        conn = http.client.HTTPConnection("127.0.0.1", self.port)
+        conn.request("GET", f"/media/{self.show_path}/{self.filename}")
+        resp = conn.getresponse()
+        body = resp.read()
+        self.assertEqual(resp.status, 200)
+        self.assertEqual(resp.getheader("Content-Length"), "11")
+        self.assertEqual(body, b"hello world")
+        conn.close()
+
     def test_invalid_range(self) -> None:
         conn = http.client.HTTPConnection("127.0.0.1", self.port)
         conn.request(
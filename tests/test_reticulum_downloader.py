@@ -0,0 +1,239 @@
+import gc
+import threading
+import time
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from nomadcastd import reticulum_downloader
+from nomadcastd.reticulum_downloader import (
+    NomadnetDownloader,
+    _drop_cached_link,
+    _get_cached_link,
+    _put_cached_link,
+    close_cached_links,
+)
+
+
+class FakeLink:
+    """Minimal link stand-in that records teardown calls."""
+
+    def __init__(self) -> None:
+        self.torn_down = False
+
+    def teardown(self) -> None:
+        self.torn_down = True
+
+
+class LinkCacheTests(unittest.TestCase):
+    """Unit tests for the shared NomadNet link cache."""
+
+    def setUp(self) -> None:
+        """Start each test with an empty cache."""
+        reticulum_downloader._link_cache.clear()
+        self.addCleanup(reticulum_downloader._link_cache.clear)
+
+    def test_put_evicts_and_tears_down_least_recently_used_link(self) -> None:
+        """Overflowing the cache should tear down the least recently used link."""
+        with mock.patch.object(reticulum_downloader, "_LINK_CACHE_MAX", 2):
+            first, second, third = FakeLink(), FakeLink(), FakeLink()
+            _put_cached_link(b"a", first)
+            _put_cached_link(b"b", second)
+            self.assertIs(_get_cached_link(b"a"), first)
+            _put_cached_link(b"c", third)
+
+        self.assertTrue(second.torn_down)
+        self.assertFalse(first.torn_down)
+        self.assertIsNone(_get_cached_link(b"b"))
+        self.assertIs(_get_cached_link(b"c"), third)
+
+    def test_drop_ignores_replaced_link(self) -> None:
+        """Closing a stale link should not evict its replacement."""
+        stale, current = FakeLink(), FakeLink()
+        _put_cached_link(b"a", stale)
+        _put_cached_link(b"a", current)
+
+        _drop_cached_link(b"a", stale)
+        self.assertIs(_get_cached_link(b"a"), current)
+        _drop_cached_link(b"a", current)
+        self.assertIsNone(_get_cached_link(b"a"))
+
+    def test_close_tears_down_every_cached_link(self) -> None:
+        """Closing the cache should tear down and forget all links."""
+        links = [FakeLink(), FakeLink()]
+        _put_cached_link(b"a", links[0])
+        _put_cached_link(b"b", links[1])
+
+        close_cached_links()
+
+        self.assertTrue(all(link.torn_down for link in links))
+        self.assertIsNone(_get_cached_link(b"a"))
+
+
+class FakeTransport:
+    """Transport stand-in with no known paths that counts path requests."""
+
+    def __init__(self) -> None:
+        self.path_requests = 0
+
+    def has_path(self, destination_hash: bytes) -> bool:
+        return False
+
+    def request_path(self, destination_hash: bytes) -> None:
+        self.path_requests += 1
+
+
+class PathLookupTests(unittest.TestCase):
+    """Unit tests for NomadnetDownloader path lookup."""
+
+    def setUp(self) -> None:
+        """Start each test without remembered path failures."""
+        reticulum_downloader._path_failures.clear()
+        self.addCleanup(reticulum_downloader._path_failures.clear)
+
+    def test_recent_path_failure_fails_fast(self) -> None:
+        """A destination whose lookup just timed out should not be looked up again."""
+        transport = FakeTransport()
+        rns = SimpleNamespace(Transport=transport)
+        failures: list[str] = []
+
+        for _ in range(2):
+            downloader = NomadnetDownloader(
+                rns,  # type: ignore[arg-type]
+                b"\x01" * 16,
+                "/file/show/feed.rss",
+                None,
+                lambda receipt: None,
+                failures.append,
+                lambda progress: None,
+            )
+            downloader.download(path_lookup_timeout=0)
+
+        self.assertEqual(transport.path_requests, 1)
+        self.assertEqual(len(failures), 2)
+        self.assertEqual(reticulum_downloader._link_setup_locks, {})
+
+
+class FakeDestination:
+    """Destination stand-in exposing the constants NomadnetDownloader reads."""
+
+    OUT = 1
+    SINGLE = 1
+
+    def __init__(self, *args: object) -> None:
+        self.args = args
+
+
+class SharedLinkTests(unittest.TestCase):
+    """Concurrent fetches to one destination should share a link."""
+
+    def setUp(self) -> None:
+        """Start each test with an empty link cache."""
+        reticulum_downloader._link_cache.clear()
+        self.addCleanup(reticulum_downloader._link_cache.clear)
+
+    def test_concurrent_downloads_open_one_link(self) -> None:
+        """A fetch waiting on link setup should reuse the link it produced."""
+        links: list[object] = []
+        requests: list[str] = []
+
+        class FakeRNSLink:
+            ACTIVE = 2
+            CLOSED = 0
+
+            def __init__(self, destination: object, established_callback=None, closed_callback=None) -> None:
+                self.status = 1
+                links.append(self)
+
+                def establish() -> None:
+                    time.sleep(0.05)
+                    self.status = self.ACTIVE
+                    established_callback(self)
+
+                threading.Thread(target=establish, daemon=True).start()
+
+            def request(self, path: str, **_kwargs: object) -> None:
+                requests.append(path)
+
+            def teardown(self) -> None:
+                self.status = self.CLOSED
+
+        rns = SimpleNamespace(
+            Link=FakeRNSLink,
+            Destination=FakeDestination,
+            Identity=SimpleNamespace(recall=lambda destination_hash: object()),
+            Transport=SimpleNamespace(has_path=lambda destination_hash: True),
+        )
+
+        def fetch(path: str) -> None:
+            downloader = NomadnetDownloader(
+                rns,  # type: ignore[arg-type]
+                b"\x02" * 16,
+                path,
+                None,
+                lambda receipt: None,
+                lambda message: None,
+                lambda progress: None,
+            )
+            downloader.download(link_establishment_timeout=5)
+
+        threads = [threading.Thread(target=fetch, args=(f"/file/show/media/{n}.mp3",)) for n in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        self.assertEqual(len(links), 1)
+        self.assertEqual(sorted(requests), ["/file/show/media/0.mp3", "/file/show/media/1.mp3"])
+        self.assertEqual(reticulum_downloader._link_setup_locks, {})
+
+    def test_late_link_is_cached_without_reviving_abandoned_request(self) -> None:
+        """A link established after its fetch gave up should be cached but send nothing."""
+        establish: list[object] = []
+        requests: list[str] = []
+
+        class SlowLink:
+            ACTIVE = 2
+            CLOSED = 0
+
+            def __init__(self, destination: object, established_callback=None, closed_callback=None) -> None:
+                self.status = 1
+                establish.append(established_callback)
+
+            def request(self, path: str, **_kwargs: object) -> None:
+                requests.append(path)
+
+            def teardown(self) -> None:
+                self.status = self.CLOSED
+
+        rns = SimpleNamespace(
+            Link=SlowLink,
+            Destination=FakeDestination,
+            Identity=SimpleNamespace(recall=lambda destination_hash: object()),
+            Transport=SimpleNamespace(has_path=lambda destination_hash: True),
+        )
+        failures: list[str] = []
+        downloader = NomadnetDownloader(
+            rns,  # type: ignore[arg-type]
+            b"\x03" * 16,
+            "/file/show/feed.rss",
+            None,
+            lambda receipt: None,
+            failures.append,
+            lambda progress: None,
+        )
+        downloader.download(link_establishment_timeout=0)
+        self.assertEqual(len(failures), 1)
+        del downloader
+        gc.collect()
+
+        link = SlowLink(None)
+        link.status = SlowLink.ACTIVE
+        establish[0](link)
+
+        self.assertEqual(requests, [])
+        self.assertIs(_get_cached_link(b"\x03" * 16), link)
+
+
+if __name__ == "__main__":
+    unittest.main()
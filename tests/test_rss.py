@@ -1,7 +1,7 @@
 import unittest
 
 from nomadcastd.parsing import encode_show_path
-from nomadcastd.rss import rewrite_rss
+from nomadcastd.rss import feed_poll_interval, latest_items, parse_rss_items, rewrite_rss, sorted_items
 
 
 class RssRewriteTests(unittest.TestCase):
@@ -33,6 +33,45 @@ class RssRewriteTests(unittest.TestCase):
             output,
         )
 
+    def test_rewrite_accepts_preparsed_feed(self) -> None:
+        rss = b"""<rss version="2.0"><channel>
+    <item><enclosure url="nomadcast:a7c3e9b14f2d6a80715c9e3b1a4d8f20:BestShow/media/ep1.mp3" /></item>
+    <item><enclosure url="nomadcast:a7c3e9b14f2d6a80715c9e3b1a4d8f20:BestShow/media/ep2.mp3" /></item>
+</channel></rss>
+"""
+        kwargs = {
+            "rss_bytes": rss,
+            "listen_host": "127.0.0.1",
+            "listen_port": 5050,
+            "show_path": encode_show_path("a7c3e9b14f2d6a80715c9e3b1a4d8f20", "BestShow"),
+            "cached_filenames": {"ep2.mp3"},
+            "episodes_per_show": 5,
+            "strict_cached": True,
+        }
+        self.assertEqual(rewrite_rss(**kwargs, parsed=parse_rss_items(rss)), rewrite_rss(**kwargs))
+
+    def test_rewrite_keeps_channel_metadata_and_drops_uncached_items(self) -> None:
+        rss = b"""<rss version="2.0"><channel>
+    <title>Example</title>
+    <item><title>One</title><enclosure url="nomadcast:a7c3e9b14f2d6a80715c9e3b1a4d8f20:BestShow/media/ep1.mp3" /></item>
+    <link>https://example.invalid/</link>
+    <item><title>Two</title><enclosure url="nomadcast:a7c3e9b14f2d6a80715c9e3b1a4d8f20:BestShow/media/ep2.mp3" /></item>
+</channel></rss>
+"""
+        output = rewrite_rss(
+            rss_bytes=rss,
+            listen_host="127.0.0.1",
+            listen_port=5050,
+            show_path=encode_show_path("a7c3e9b14f2d6a80715c9e3b1a4d8f20", "BestShow"),
+            cached_filenames={"ep2.mp3"},
+            episodes_per_show=5,
+            strict_cached=True,
+        )
+        tree, items, _ = parse_rss_items(output)
+        channel = tree.getroot().find("channel")
+        self.assertEqual([child.tag for child in channel], ["title", "link", "item"])
+        self.assertEqual([item.element.findtext("title") for item in items], ["Two"])
+
     def test_rewrite_enclosure_with_encoded_filename(self) -> None:
         rss = b"""<?xml version="1.0" encoding="UTF-8"?>
 <rss version="2.0">
@@ -60,6 +99,47 @@ class RssRewriteTests(unittest.TestCase):
             output,
         )
 
+    def test_parse_rss_items_reports_pub_dates(self) -> None:
+        rss = b"""<rss version="2.0"><channel>
+    <item><title>Undated</title></item>
+    <item><title>Bad date</title><pubDate>not a date</pubDate></item>
+</channel></rss>
+"""
+        _, items, has_pub_dates = parse_rss_items(rss)
+        self.assertEqual(len(items), 2)
+        self.assertFalse(has_pub_dates)
+
+        dated = rss.replace(b"not a date", b"Tue, 02 Jan 2024 10:00:00 GMT")
+        _, _, has_pub_dates = parse_rss_items(dated)
+        self.assertTrue(has_pub_dates)
+
+    def test_feed_poll_interval_reads_ttl_and_syndication(self) -> None:
+        ttl_tree, _, _ = parse_rss_items(b"<rss><channel><ttl>60</ttl></channel></rss>")
+        self.assertEqual(feed_poll_interval(ttl_tree), 3600)
+
+        sy_tree, _, _ = parse_rss_items(
+            b'<rss xmlns:sy="http://purl.org/rss/1.0/modules/syndication/"><channel>'
+            b"<sy:updatePeriod>daily</sy:updatePeriod><sy:updateFrequency>2</sy:updateFrequency>"
+            b"</channel></rss>"
+        )
+        self.assertEqual(feed_poll_interval(sy_tree), 43200)
+
+        plain_tree, _, _ = parse_rss_items(b"<rss><channel><ttl>soon</ttl></channel></rss>")
+        self.assertIsNone(feed_poll_interval(plain_tree))
+
+    def test_latest_items_matches_sorted_prefix(self) -> None:
+        rss = b"""<rss version="2.0"><channel>
+    <item><title>Mid</title><pubDate>Tue, 02 Jan 2024 10:00:00 GMT</pubDate></item>
+    <item><title>Undated</title></item>
+    <item><title>New</title><pubDate>Wed, 03 Jan 2024 10:00:00 GMT</pubDate></item>
+    <item><title>Old</title><pubDate>Mon, 01 Jan 2024 10:00:00 GMT</pubDate></item>
+</channel></rss>
+"""
+        _, items, has_pub_dates = parse_rss_items(rss)
+        expected = sorted_items(items, has_pub_dates)[:2]
+        self.assertEqual(latest_items(items, has_pub_dates, 2), expected)
+        self.assertEqual([item.element.findtext("title") for item in expected], ["New", "Mid"])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,8 +1,11 @@
 import http.client
+import os
+import tempfile
 import threading
 import unittest
 from pathlib import Path
 from tempfile import TemporaryDirectory
+from types import SimpleNamespace
 
 from nomadcastd.parsing import encode_show_path
 from nomadcastd.server import NomadCastHTTPServer, NomadCastRequestHandler
@@ -17,6 +20,7 @@ class StubDaemon:
     media_path: Path | None
     refresh_calls: list[str]
     media_calls: list[tuple[str, str]]
+    config: SimpleNamespace
 
     def __init__(self, show_id: str, show_path: str) -> None:
         self.show_id = show_id
@@ -25,6 +29,7 @@ class StubDaemon:
         self.media_path = None
         self.refresh_calls = []
         self.media_calls = []
+        self.config = SimpleNamespace(rss_poll_seconds=900)
 
     def show_id_from_path(self, show_path: str) -> str | None:
         if show_path == self.show_path:
@@ -34,11 +39,19 @@ class StubDaemon:
     def enqueue_refresh(self, show_id: str) -> None:
         self.refresh_calls.append(show_id)
 
-    def get_cached_rss(self, show_id: str) -> bytes | None:
-        return self.cached_rss
+    def get_cached_rss_fd(self, show_id: str) -> tuple[int, int] | None:
+        if self.cached_rss is None:
+            return None
+        with tempfile.TemporaryFile() as handle:
+            handle.write(self.cached_rss)
+            handle.flush()
+            return os.dup(handle.fileno()), len(self.cached_rss)
 
-    def get_media_path(self, show_id: str, filename: str) -> Path | None:
-        return self.media_path
+    def get_media_fd(self, show_id: str, filename: str) -> tuple[int, int] | None:
+        if self.media_path is None:
+            return None
+        fd = os.open(self.media_path, os.O_RDONLY)
+        return fd, os.fstat(fd).st_size
 
     def enqueue_media_fetch(self, show_id: str, filename: str) -> None:
         self.media_calls.append((show_id, filename))
@@ -88,6 +101,20 @@ class ServerEndpointTests(unittest.TestCase):
         self.assertIn(b"Refresh queued", body)
         self.assertEqual(self.daemon.refresh_calls, [self.show_id])
 
+    def test_feeds_serves_cached_rss(self) -> None:
+        """A cached feed should be returned with its length."""
+        self.daemon.cached_rss = b"<rss><channel /></rss>"
+        conn = http.client.HTTPConnection("127.0.0.1", self.port)
+        conn.request("GET", f"/feeds/{self.show_path}")
+        resp = conn.getresponse()
+        body = resp.read()
+        conn.close()
+
+        self.assertEqual(resp.status, 200)
+        self.assertEqual(resp.getheader("Content-Length"), str(len(body)))
+        self.assertEqual(body, b"<rss><channel /></rss>")
+        self.assertEqual(self.daemon.refresh_calls, [self.show_id])
+
     def test_media_returns_404_when_cache_missing(self) -> None:
         """A missing cached media file should return 404 and enqueue fetch."""
         conn = http.client.HTTPConnection("127.0.0.1", self.port)
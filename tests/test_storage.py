@@ -1,5 +1,6 @@
 import json
 import unittest
+from dataclasses import asdict
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
@@ -27,10 +28,10 @@ class StorageStateTests(unittest.TestCase):
             subscription_uri="nomadcast:abc123abc123abc123abc123abc123ab:Show",
             show_name="Show",
             last_refresh=123.0,
-            cached_episodes=[
-                CachedEpisode(filename="b.mp3", order_index=1, size_bytes=20),
-                CachedEpisode(filename="a.mp3", order_index=0, size_bytes=10),
-            ],
+            cached_episodes={
+                "b.mp3": CachedEpisode(filename="b.mp3", order_index=1, size_bytes=20),
+                "a.mp3": CachedEpisode(filename="a.mp3", order_index=0, size_bytes=10),
+            },
         )
 
         save_show_state(self.state_path, state)
@@ -40,7 +41,7 @@ class StorageStateTests(unittest.TestCase):
         self.assertEqual(loaded.show_name, state.show_name)
         self.assertEqual(loaded.last_refresh, 123.0)
         self.assertEqual(
-            [episode.filename for episode in loaded.cached_episodes],
+            [episode.filename for episode in loaded.cached_episodes.values()],
             ["b.mp3", "a.mp3"],
         )
 
@@ -57,7 +58,7 @@ class StorageStateTests(unittest.TestCase):
             subscription_uri=state.subscription_uri,
             show_name="Show",
             failure_count=2,
-            cached_episodes=[CachedEpisode(filename="ep.mp3", order_index=0, size_bytes=1)],
+            cached_episodes={"ep.mp3": CachedEpisode(filename="ep.mp3", order_index=0, size_bytes=1)},
         )
         save_show_state(self.state_path, updated)
 
@@ -65,6 +66,19 @@ class StorageStateTests(unittest.TestCase):
         self.assertEqual(contents["failure_count"], 2)
         self.assertFalse(tmp_path.exists())
 
+    def test_to_json_matches_dataclass_fields(self) -> None:
+        """The hand-written serializer should cover every ShowState field."""
+        state = ShowState(
+            subscription_uri="nomadcast:abc123abc123abc123abc123abc123ab:Show",
+            show_name="Show",
+            last_error="boom",
+            failure_count=3,
+            last_backoff=12.5,
+            feed_poll_seconds=3600,
+            cached_episodes={"ep.mp3": CachedEpisode(filename="ep.mp3", order_index=0, size_bytes=1)},
+        )
+        self.assertEqual(state.to_json(), asdict(state))
+
     def test_load_show_state_defaults_when_missing(self) -> None:
         """Missing state.json should yield defaults seeded from inputs."""
         state = load_show_state(
@@ -74,7 +88,25 @@ class StorageStateTests(unittest.TestCase):
         )
         self.assertEqual(state.subscription_uri, "nomadcast:abc123abc123abc123abc123abc123ab:Show")
         self.assertEqual(state.show_name, "Show")
-        self.assertEqual(state.cached_episodes, [])
+        self.assertEqual(state.cached_episodes, {})
+
+    def test_load_show_state_accepts_legacy_episode_list(self) -> None:
+        """List-shaped cached_episodes from older state.json files should still load."""
+        self.state_path.write_text(
+            json.dumps(
+                {
+                    "subscription_uri": "nomadcast:abc123abc123abc123abc123abc123ab:Show",
+                    "show_name": "Show",
+                    "cached_episodes": [{"filename": "ep.mp3", "order_index": 0, "size_bytes": 7}],
+                }
+            ),
+            encoding="utf-8",
+        )
+        state = load_show_state(self.state_path, "", "")
+        self.assertEqual(
+            state.cached_episodes,
+            {"ep.mp3": CachedEpisode(filename="ep.mp3", order_index=0, size_bytes=7)},
+        )
 
 
 if __name__ == "__main__":